@@ -4,7 +4,8 @@ import json
 import asyncio
 
 from aexis.core.system import load_network_data
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import FastAPI, HTTPException, Response, WebSocket, WebSocketDisconnect
 
 from ..core.errors import handle_exception
 from ..core.system import AexisSystem
@@ -14,6 +15,11 @@ from pydantic import BaseModel
 logger = logging.getLogger(__name__)
 
 
+def _json_response(data) -> Response:
+    """Serialize straight to bytes, skipping FastAPI's jsonable_encoder pass"""
+    return Response(orjson.dumps(data), media_type="application/json")
+
+
 class PassengerRequestModel(BaseModel):
     origin: str
     destination: str
@@ -48,7 +54,7 @@ class SystemAPI:
         async def get_system_status():
             """Get overall system status"""
             try:
-                return self.system.get_system_state()
+                return _json_response(self.system.get_system_state())
             except Exception as e:
                 error_details = handle_exception(e, "SystemAPI")
                 raise HTTPException(
@@ -58,7 +64,7 @@ class SystemAPI:
         async def get_system_metrics():
             """Get system metrics"""
             try:
-                return self.system.metrics
+                return _json_response(self.system.metrics)
             except Exception as e:
                 error_details = handle_exception(e, "SystemAPI")
                 raise HTTPException(
@@ -68,9 +74,9 @@ class SystemAPI:
         async def get_all_pods():
             """Get all pod states"""
             try:
-                return {
+                return _json_response({
                     pod_id: pod.get_state() for pod_id, pod in self.system.pods.items()
-                }
+                })
             except Exception as e:
                 error_details = handle_exception(e, "SystemAPI")
                 raise HTTPException(
@@ -84,7 +90,7 @@ class SystemAPI:
                 if not pod_state:
                     raise HTTPException(
                         status_code=404, detail="Pod not found")
-                return pod_state
+                return _json_response(pod_state)
             except HTTPException:
                 raise
             except Exception as e:
@@ -96,10 +102,10 @@ class SystemAPI:
         async def get_all_stations():
             """Get all station states"""
             try:
-                return {
+                return _json_response({
                     station_id: station.get_state()
                     for station_id, station in self.system.stations.items()
-                }
+                })
             except Exception as e:
                 error_details = handle_exception(e, "SystemAPI")
                 raise HTTPException(
@@ -113,7 +119,7 @@ class SystemAPI:
                 if not station_state:
                     raise HTTPException(
                         status_code=404, detail="Station not found")
-                return station_state
+                return _json_response(station_state)
             except HTTPException:
                 raise
             except Exception as e:
@@ -238,7 +244,7 @@ class SystemAPI:
                     raise HTTPException(
                         status_code=404, detail="Network data not found"
                     )
-                return data
+                return _json_response(data)
             except HTTPException:
                 raise
             except Exception as e:
@@ -2,16 +2,19 @@ import asyncio
 import json
 import logging
 import sys
-from typing import Dict, Any, Optional, List, Callable, Union
+import uuid
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Callable, Union
 from enum import Enum
 from datetime import datetime
 
-import redis.asyncio as redis
-from redis.asyncio import Redis
-
 from .errors import ErrorCode, create_error, handle_exception
 from .model import Command, Event
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
 logging.basicConfig(
     level=logging.WARN,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -22,6 +25,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from redis.asyncio import ConnectionPool, Redis
+
+
+def _get_redis():
+    """Import the redis client lazily so in-memory buses never load it"""
+    import redis.asyncio as redis
+
+    return redis
+
 
 class AexisJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder for Aexis models (handles datetime, Enum, etc.)"""
@@ -33,30 +46,61 @@ class AexisJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _event_default(obj):
+    """orjson fallback hook matching AexisJSONEncoder's datetime format"""
+    if isinstance(obj, datetime):
+        return obj.strftime('%Y-%m-%d %H:%M:%S')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _loads(data: bytes | str) -> Any:
+    """Decode a bus payload; raises json.JSONDecodeError on malformed input"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class MessageBus:
     """Redis-based message bus for event-driven communication"""
 
+    # Reconnect backoff bounds in seconds (doubles per failed attempt)
+    RECONNECT_BASE_DELAY = 1.0
+    RECONNECT_MAX_DELAY = 60.0
+
     def __init__(
-        self, redis_url: str = "redis://localhost:6379", password: str | None = None
+        self,
+        redis_url: str = "redis://localhost:6379",
+        password: str | None = None,
+        connection_pool: "ConnectionPool | None" = None,
     ):
         self.redis_url = redis_url
         self.password = password
-        self.redis_client: Redis | None = None
+        # Shared pool (see create_connection_pool); None: a private pool per client
+        self.connection_pool = connection_pool
+        self.redis_client: "Redis | None" = None
         self.pubsub = None
         self.subscribers: dict[str, list[Callable]] = {}
         self.running = False
 
     async def connect(self) -> bool:
         """Initialize Redis connection"""
+        redis = _get_redis()
+        # A repeated connect() replaces the client and pubsub; close the old ones so
+        # their connections are released and the listener moves to the new pubsub
+        await self._close_connections()
         try:
-            self.redis_client = redis.from_url(
-                self.redis_url,
-                password=self.password,
-                decode_responses=True,
-                socket_connect_timeout=10,
-                socket_timeout=5,
-                retry_on_timeout=True,
-            )
+            if self.connection_pool is not None:
+                # Closing this client leaves the shared pool open
+                self.redis_client = redis.Redis(connection_pool=self.connection_pool)
+            else:
+                self.redis_client = redis.from_url(
+                    self.redis_url,
+                    password=self.password,
+                    decode_responses=True,
+                    socket_connect_timeout=10,
+                    socket_timeout=5,
+                    retry_on_timeout=True,
+                )
 
             # Test connection
             await self.redis_client.ping()
@@ -64,6 +108,9 @@ class MessageBus:
             # Create pubsub for subscription handling
             self.pubsub = self.redis_client.pubsub()
 
+            # Replay existing subscriptions onto the fresh pubsub
+            await self._resubscribe_all()
+
             logger.info("Connected to Redis message bus")
             return True
 
@@ -92,6 +139,59 @@ class MessageBus:
             )
             return False
 
+    @staticmethod
+    def create_connection_pool(
+        redis_url: str = "redis://localhost:6379",
+        password: str | None = None,
+        max_connections: int = 32,
+    ) -> "ConnectionPool":
+        """Build a connection pool with the bus's client options, for sharing across buses"""
+        redis = _get_redis()
+        return redis.ConnectionPool.from_url(
+            redis_url,
+            password=password,
+            max_connections=max_connections,
+            decode_responses=True,
+            socket_connect_timeout=10,
+            socket_timeout=5,
+            retry_on_timeout=True,
+        )
+
+    async def reconnect(self) -> bool:
+        """Reconnect with exponential backoff until connected or the bus stops
+
+        The delay starts at RECONNECT_BASE_DELAY for every reconnect episode, so a
+        long-running bus never stays pinned at the cap after it recovers.
+        """
+        delay = self.RECONNECT_BASE_DELAY
+        while self.running:
+            if await self.connect():
+                return True
+            logger.warning(f"Redis reconnect failed, retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+        return False
+
+    async def _close_connections(self):
+        """Best-effort close of a possibly broken client and pubsub"""
+        for conn in (self.pubsub, self.redis_client):
+            if conn is None:
+                continue
+            try:
+                await conn.aclose()
+            except Exception as e:
+                logger.debug(f"Ignoring error closing stale Redis connection: {e}")
+
+    async def _subscribe_channel(self, channel: str):
+        """Start receiving a newly subscribed channel from Redis"""
+        if self.pubsub:
+            await self.pubsub.subscribe(channel)
+
+    async def _resubscribe_all(self):
+        """Subscribe the current pubsub to every channel with registered handlers"""
+        if self.pubsub and self.subscribers:
+            await self.pubsub.subscribe(*self.subscribers)
+
     async def disconnect(self):
         """Close Redis connection"""
         try:
@@ -107,6 +207,7 @@ class MessageBus:
 
     async def publish_event(self, channel: str, event: Event) -> bool:
         """Publish event to Redis channel"""
+        redis = _get_redis()
         try:
             if not self.redis_client:
                 raise create_error(
@@ -126,14 +227,7 @@ class MessageBus:
                     },
                 )
 
-            # Serialize the entire event dataclass, not just event.data
-            from dataclasses import asdict
-
-            event_dict = asdict(event)
-            message = {"channel": channel, "message": event_dict}
-
-            json_data = json.dumps(message, cls=AexisJSONEncoder)
-            await self.redis_client.publish(channel, json_data)
+            await self._send(channel, self._serialize_event(channel, event))
             return True
 
         except redis.ConnectionError as e:
@@ -168,6 +262,7 @@ class MessageBus:
 
     async def publish_command(self, channel: str, command: Command) -> bool:
         """Publish command to Redis channel"""
+        redis = _get_redis()
         try:
             if not self.redis_client:
                 raise create_error(
@@ -187,23 +282,7 @@ class MessageBus:
                     },
                 )
 
-            from dataclasses import asdict
-            command_dict = asdict(command)
-
-            # Convert all datetime objects to ISO strings
-            for key, value in command_dict.items():
-                if isinstance(value, datetime):
-                    command_dict[key] = value.isoformat()
-                elif key == "timestamp" and not isinstance(value, str):
-                    # Ensure timestamp is ISO string if not already
-                    command_dict[key] = value.isoformat()
-
-            message = {
-                "channel": channel,
-                "message": command_dict,
-            }
-
-            await self.redis_client.publish(channel, json.dumps(message))
+            await self._send(channel, self._serialize_command(channel, command))
             logger.debug(f"Published {command.command_type} to {channel}")
             return True
 
@@ -239,6 +318,117 @@ class MessageBus:
             )
             return False
 
+    async def publish_batch(
+        self, channel: str, payloads: List[Union[Event, Command, bytes]]
+    ) -> bool:
+        """Publish several events/commands to one channel in a single round-trip
+
+        Payloads may also be pre-serialized bytes (see serialize_command).
+        """
+        redis = _get_redis()
+        try:
+            if not self.redis_client:
+                raise create_error(
+                    ErrorCode.REDIS_CONNECTION_FAILED,
+                    component="MessageBus",
+                    context={"operation": "publish_batch"},
+                )
+
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for payload in payloads:
+                    self._queue_send(pipe, channel, self._serialize(channel, payload))
+                await pipe.execute()
+            return True
+
+        except redis.ConnectionError as e:
+            error = create_error(
+                ErrorCode.REDIS_PUBLISH_FAILED,
+                component="MessageBus",
+                context={
+                    "channel": channel,
+                    "batch_size": len(payloads),
+                    "original_error": str(e),
+                },
+            )
+            logger.error(error.message)
+            return False
+
+        except (TypeError, ValueError) as e:
+            error = create_error(
+                ErrorCode.EVENT_DATA_INVALID,
+                component="MessageBus",
+                context={"channel": channel, "original_error": str(e)},
+            )
+            logger.error(error.message)
+            return False
+
+        except Exception as e:
+            error_details = handle_exception(e, "MessageBus")
+            logger.error(f"Unexpected error publishing batch: {error_details.message}")
+            return False
+
+    async def _send(self, channel: str, payload: bytes | str):
+        """Deliver one serialized message to the channel"""
+        await self.redis_client.publish(channel, payload)
+
+    def _queue_send(self, pipe, channel: str, payload: bytes | str):
+        """Queue one serialized message on a pipeline (see publish_batch)"""
+        pipe.publish(channel, payload)
+
+    def serialize_command(self, channel: str, command: Command) -> bytes:
+        """Serialize a command once for repeated publishing via publish_batch"""
+        payload = self._serialize_command(channel, command)
+        return payload.encode() if isinstance(payload, str) else payload
+
+    def _serialize(
+        self, channel: str, payload: Union[Event, Command, bytes]
+    ) -> bytes | str:
+        """Serialize an event or command into the bus wire format"""
+        if isinstance(payload, (bytes, str)):
+            # Already serialized by the caller
+            return payload
+        if isinstance(payload, Command):
+            return self._serialize_command(channel, payload)
+        return self._serialize_event(channel, payload)
+
+    @staticmethod
+    def _serialize_event(channel: str, event: Event) -> bytes | str:
+        """Serialize the entire event dataclass, not just event.data"""
+        from dataclasses import asdict
+
+        message = {"channel": channel, "message": asdict(event)}
+        if orjson is not None:
+            # Passthrough keeps the bus's "%Y-%m-%d %H:%M:%S" timestamp format
+            return orjson.dumps(
+                message,
+                default=_event_default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        return json.dumps(message, cls=AexisJSONEncoder)
+
+    @staticmethod
+    def _serialize_command(channel: str, command: Command) -> bytes | str:
+        """Serialize a command with its datetimes as ISO strings"""
+        from dataclasses import asdict
+
+        command_dict = asdict(command)
+
+        # Convert all datetime objects to ISO strings
+        for key, value in command_dict.items():
+            if isinstance(value, datetime):
+                command_dict[key] = value.isoformat()
+            elif key == "timestamp" and not isinstance(value, str):
+                # Ensure timestamp is ISO string if not already
+                command_dict[key] = value.isoformat()
+
+        message = {
+            "channel": channel,
+            "message": command_dict,
+        }
+        if orjson is not None:
+            return orjson.dumps(message)
+        return json.dumps(message)
+
     def subscribe(self, channel: str, handler: Callable):
         """Subscribe to channel with event handler"""
         try:
@@ -255,8 +445,8 @@ class MessageBus:
             if channel not in self.subscribers:
                 self.subscribers[channel] = []
                 # If already running, we need to subscribe in Redis too
-                if self.running and self.pubsub:
-                    asyncio.create_task(self.pubsub.subscribe(channel))
+                if self.running:
+                    asyncio.create_task(self._subscribe_channel(channel))
                     logger.info(f"Dynamically subscribed to Redis channel: {channel}")
 
             self.subscribers[channel].append(handler)
@@ -287,6 +477,7 @@ class MessageBus:
 
     async def start_listening(self):
         """Start listening for subscribed channels"""
+        redis = _get_redis()
         try:
             if not self.pubsub:
                 raise create_error(
@@ -322,6 +513,9 @@ class MessageBus:
                     else:
                         # Yield control if no message
                         await asyncio.sleep(0.01)
+                except redis.ConnectionError as e:
+                    logger.warning(f"Lost Redis connection, reconnecting: {e}")
+                    await self.reconnect()
                 except Exception as e:
                     # Log error but keep loop running unless fatal
                     # Transient errors shouldn't crash the listener
@@ -333,19 +527,19 @@ class MessageBus:
             logger.error(f"Error in message listening loop: {error_details.message}")
             self.running = False
 
-    async def _handle_message(self, message):
-        """Handle incoming Redis message"""
+    async def _handle_message(self, message) -> bool:
+        """Handle incoming Redis message; returns False if it could not be processed"""
         try:
             channel = message["channel"]
 
             # Validate channel has subscribers
             if channel not in self.subscribers:
                 logger.warning(f"Received message on unsubscribed channel: {channel}")
-                return
+                return True
 
             # Parse message data
             try:
-                data = json.loads(message["data"])
+                data = _loads(message["data"])
             except json.JSONDecodeError as e:
                 error = create_error(
                     ErrorCode.EVENT_DATA_INVALID,
@@ -353,7 +547,7 @@ class MessageBus:
                     context={"channel": channel, "original_error": str(e)},
                 )
                 logger.error(error.message)
-                return
+                return False
 
             # Call all subscribers for this channel
             for handler in list(self.subscribers[channel]):
@@ -365,10 +559,12 @@ class MessageBus:
                 except Exception as e:
                     error_details = handle_exception(e, f"Handler-{channel}")
                     logger.error(f"Handler error on {channel}: {error_details.message}")
+            return True
 
         except Exception as e:
             error_details = handle_exception(e, "MessageBus")
             logger.error(f"Failed to handle message: {error_details.message}")
+            return False
 
     async def stop_listening(self):
         """Stop listening for messages"""
@@ -392,6 +588,8 @@ class MessageBus:
         "POD_COMMANDS": "aexis:commands:pods",
         "STATION_COMMANDS": "aexis:commands:stations",
         "SYSTEM_COMMANDS": "aexis:commands:system",
+        # Full get_system_state() documents pushed to dashboards
+        "SYSTEM_STATE": "aexis:system_state",
     }
 
     @classmethod
@@ -427,12 +625,179 @@ class MessageBus:
             return cls.CHANNELS["SYSTEM_COMMANDS"]
 
 
+class StreamMessageBus(MessageBus):
+    """Redis Streams message bus: XADD to publish, XREADGROUP to consume
+
+    CHANNELS double as stream names. Each service reads through its own named
+    consumer group, so every service still sees every message (pub/sub fan-out),
+    and delivery survives restarts: the group resumes from its last acknowledged
+    entry. Without a group name the bus uses a throwaway group, destroyed on
+    disconnect. Entries whose payload cannot be decoded are copied to
+    "<stream>:dead" and acknowledged so they are not redelivered.
+    """
+
+    DEAD_LETTER_SUFFIX = ":dead"
+    DEFAULT_MAXLEN = 10_000
+    # Snapshot channels only need the latest few entries
+    CHANNEL_MAXLEN = {MessageBus.CHANNELS["SYSTEM_STATE"]: 100}
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        password: str | None = None,
+        connection_pool: "ConnectionPool | None" = None,
+        group: str | None = None,
+        batch_size: int = 64,
+        block_ms: int = 100,
+        maxlen: int = DEFAULT_MAXLEN,
+        channel_maxlen: dict[str, int] | None = None,
+    ):
+        super().__init__(redis_url, password, connection_pool)
+        # Ephemeral groups have no stable owner, so this bus cleans them up
+        self.ephemeral_group = not group
+        self.group = group or f"aexis-{uuid.uuid4().hex[:8]}"
+        self.consumer = f"{self.group}-consumer"
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        # Approximate cap per stream so unread history cannot grow unbounded
+        self.maxlen = maxlen
+        self.channel_maxlen = {**self.CHANNEL_MAXLEN, **(channel_maxlen or {})}
+        self._groups: set[str] = set()
+
+    def _maxlen_for(self, channel: str) -> int:
+        """Approximate MAXLEN for one stream"""
+        return self.channel_maxlen.get(channel, self.maxlen)
+
+    async def _send(self, channel: str, payload: bytes | str):
+        """Append one serialized message to the channel's stream"""
+        await self.redis_client.xadd(
+            channel, {"data": payload}, maxlen=self._maxlen_for(channel), approximate=True
+        )
+
+    def _queue_send(self, pipe, channel: str, payload: bytes | str):
+        """Queue one XADD on a pipeline (see publish_batch)"""
+        pipe.xadd(
+            channel, {"data": payload}, maxlen=self._maxlen_for(channel), approximate=True
+        )
+
+    async def disconnect(self):
+        """Destroy an ephemeral consumer group, then close the connection"""
+        if self.ephemeral_group and self.redis_client:
+            for stream in list(self._groups):
+                try:
+                    await self.redis_client.xgroup_destroy(stream, self.group)
+                except Exception as e:
+                    logger.debug(f"Ignoring error destroying group {self.group} on {stream}: {e}")
+            self._groups.clear()
+        await super().disconnect()
+
+    async def _subscribe_channel(self, channel: str):
+        """Create this bus's consumer group on the stream"""
+        await self._ensure_group(channel)
+
+    async def _resubscribe_all(self):
+        """Ensure consumer groups exist for every subscribed stream"""
+        # A reconnect may follow a server restart, which drops the groups
+        self._groups.clear()
+        for channel in list(self.subscribers):
+            await self._ensure_group(channel)
+
+    async def _ensure_group(self, stream: str):
+        """Create the consumer group at the stream tail (idempotent)"""
+        redis = _get_redis()
+        if stream in self._groups or not self.redis_client:
+            return
+        try:
+            await self.redis_client.xgroup_create(
+                stream, self.group, id="$", mkstream=True
+            )
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._groups.add(stream)
+
+    async def start_listening(self):
+        """Consume all subscribed streams in batches until stopped"""
+        redis = _get_redis()
+        try:
+            if not self.redis_client:
+                raise create_error(
+                    ErrorCode.REDIS_CONNECTION_FAILED,
+                    component="StreamMessageBus",
+                    context={"operation": "start_listening"},
+                )
+
+            await self._resubscribe_all()
+            self.running = True
+
+            while self.running:
+                try:
+                    streams = {
+                        stream: ">" for stream in self.subscribers if stream in self._groups
+                    }
+                    if not streams:
+                        await asyncio.sleep(self.block_ms / 1000)
+                        continue
+
+                    entries = await self.redis_client.xreadgroup(
+                        self.group,
+                        self.consumer,
+                        streams,
+                        count=self.batch_size,
+                        block=self.block_ms,
+                    )
+                    for stream, messages in entries or []:
+                        await self._handle_stream_batch(stream, messages)
+                except redis.ConnectionError as e:
+                    logger.warning(f"Lost Redis connection, reconnecting: {e}")
+                    await self.reconnect()
+                except Exception as e:
+                    # Transient errors shouldn't crash the listener
+                    logger.warning(f"Error reading from streams: {e}")
+                    await asyncio.sleep(0.1)
+
+        except Exception as e:
+            error_details = handle_exception(e, "StreamMessageBus")
+            logger.error(f"Error in stream listening loop: {error_details.message}")
+            self.running = False
+
+    async def _handle_stream_batch(self, stream: str, messages: list):
+        """Dispatch one XREADGROUP batch, dead-letter bad entries, then XACK once"""
+        ids = []
+        dead = []
+        for msg_id, fields in messages:
+            ids.append(msg_id)
+            handled = await self._handle_message(
+                {"channel": stream, "data": fields.get("data", "")}
+            )
+            if not handled:
+                dead.append(fields)
+
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for fields in dead:
+                pipe.xadd(
+                    stream + self.DEAD_LETTER_SUFFIX,
+                    fields,
+                    maxlen=self._maxlen_for(stream),
+                    approximate=True,
+                )
+            pipe.xack(stream, self.group, *ids)
+            await pipe.execute()
+
+    async def stop_listening(self):
+        """Stop consuming streams"""
+        self.running = False
+        logger.info("Stopped listening to Redis streams")
+
+
 class LocalMessageBus(MessageBus):
     """In-memory message bus for testing and local operation (No Redis required)"""
 
     def __init__(self):
         super().__init__(redis_url="local://")
         self.subscribers: dict[str, list[Callable]] = {}
+        # Handler -> is-coroutine flag, resolved once at subscribe time
+        self._handler_is_async: dict[Callable, bool] = {}
         self.running = False
 
     async def connect(self) -> bool:
@@ -505,11 +870,28 @@ class LocalMessageBus(MessageBus):
         await self._handle_local_message(channel, message)
         return True
 
+    async def publish_batch(
+        self, channel: str, payloads: List[Union[Event, Command, bytes]]
+    ) -> bool:
+        """Dispatch each payload to local handlers in order"""
+        if not self.running:
+            return False
+
+        for payload in payloads:
+            if isinstance(payload, (bytes, str)):
+                await self._handle_local_message(channel, _loads(payload))
+            elif isinstance(payload, Command):
+                await self.publish_command(channel, payload)
+            else:
+                await self.publish_event(channel, payload)
+        return True
+
     def subscribe(self, channel: str, handler: Callable):
         """Subscribe to local channel"""
         if channel not in self.subscribers:
             self.subscribers[channel] = []
         self.subscribers[channel].append(handler)
+        self._handler_is_async[handler] = asyncio.iscoroutinefunction(handler)
 
     def unsubscribe(self, channel: str, handler: Callable):
         """Unsubscribe from local channel"""
@@ -530,7 +912,12 @@ class LocalMessageBus(MessageBus):
 
         for handler in self.subscribers[channel]:
             try:
-                if asyncio.iscoroutinefunction(handler):
+                is_async = self._handler_is_async.get(handler)
+                if is_async is None:
+                    is_async = self._handler_is_async[handler] = (
+                        asyncio.iscoroutinefunction(handler)
+                    )
+                if is_async:
                     await handler(data)
                 else:
                     handler(data)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
 from typing import Any, Optional
 from uuid import uuid4
 
@@ -209,15 +210,27 @@ class Cargo:
     assigned_pod: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class Route:
     route_id: str
-    stations: list[str]
+    stations: tuple[str, ...]
     estimated_duration: int = 0  # minutes
     distance: float = 0.0
     traffic_level: float = 0.0  # 0.0-1.0
     congestion_factor: float = 1.0
 
+    def __post_init__(self):
+        """Freeze stations so a route can be shared safely between tasks"""
+        object.__setattr__(self, "stations", tuple(self.stations))
+
+    @cached_property
+    def _station_set(self) -> frozenset[str]:
+        """Station membership index for O(1) lookups"""
+        return frozenset(self.stations)
+
+    def __contains__(self, station_id: str) -> bool:
+        return station_id in self._station_set
+
 
 @dataclass
 class DecisionContext:
@@ -334,7 +347,7 @@ class PodPositionUpdate(Event):
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'))
     status: str = "idle"
     speed: float = 0.0
-    current_route: Optional[list[str]] = None
+    current_route: Optional[tuple[str, ...]] = None
 
 @dataclass
 class PodArrival(Event):
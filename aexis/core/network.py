@@ -1,11 +1,12 @@
-import json
 import math
 import os
 import random
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import networkx as nx
+import orjson
 from .model import Coordinate, EdgeSegment
 
 
@@ -45,8 +46,7 @@ class Network:
 def load_network_data(path: str) -> dict[str, Any] | None:
     """Load network topology from JSON file and return as raw dict."""
     try:
-        with open(path) as f:
-            return json.load(f)
+        return orjson.loads(Path(path).read_bytes())
     except FileNotFoundError:
         print(f"Network file not found: {path}")
         return None
@@ -39,9 +39,120 @@ class PodType(Enum):
     CARGO = "cargo"
 
 
+class MovementResult(Enum):
+    """Outcome of one synchronous physics step (see Pod.advance)"""
+    IDLE = "idle"            # Not moving; nothing to publish
+    MOVED = "moved"          # Position changed; a position update is due
+    STOPPED = "stopped"      # Arrived at a station and began loading/unloading
+    COMPLETED = "completed"  # Route exhausted; completion handling is due
+
+
+class _MovementField:
+    """Pod attribute mirrored by PodPool; writes notify the pod's movement watcher
+
+    Defines __set__ but not __get__, so reads fall through to the instance dict
+    at plain-attribute speed and only writes pay for the notification.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __set__(self, pod, value):
+        pod.__dict__[self.name] = value
+        watcher = pod.__dict__.get("_movement_watcher")
+        if watcher is not None:
+            watcher()
+
+
+class PayloadList(list):
+    """List of payload dicts that keeps an id index for O(1) membership checks"""
+
+    def __init__(self, items=(), key: str = "id"):
+        super().__init__()
+        self._key = key
+        self._index: dict[str, int] = {}
+        self.extend(items)
+
+    def _add(self, item: dict):
+        item_id = item.get(self._key)
+        self._index[item_id] = self._index.get(item_id, 0) + 1
+
+    def _discard(self, item: dict):
+        item_id = item.get(self._key)
+        count = self._index.get(item_id, 0) - 1
+        if count > 0:
+            self._index[item_id] = count
+        else:
+            self._index.pop(item_id, None)
+
+    def _reindex(self):
+        self._index.clear()
+        for item in self:
+            self._add(item)
+
+    def contains_id(self, item_id: str) -> bool:
+        """Check whether a payload with this id is present"""
+        return item_id in self._index
+
+    def append(self, item: dict):
+        super().append(item)
+        self._add(item)
+
+    def extend(self, items):
+        items = list(items)
+        super().extend(items)
+        for item in items:
+            self._add(item)
+
+    def insert(self, index, item: dict):
+        super().insert(index, item)
+        self._add(item)
+
+    def remove(self, item: dict):
+        super().remove(item)
+        self._discard(item)
+
+    def pop(self, index=-1) -> dict:
+        item = super().pop(index)
+        self._discard(item)
+        return item
+
+    def clear(self):
+        super().clear()
+        self._index.clear()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._reindex()
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self._reindex()
+        return self
+
+    def __reduce__(self):
+        # copy/deepcopy/pickle rebuild through __init__ so the index is derived
+        # from the items rather than copied and then counted again
+        return (self.__class__, (list(self), self._key))
+
+
 class Pod(EventProcessor):
     """Base Autonomous pod class"""
 
+    # Physics state that PodPool keeps in NumPy columns
+    status = _MovementField()
+    current_segment = _MovementField()
+    segment_progress = _MovementField()
+    speed = _MovementField()
+
     def __init__(
         self,
         message_bus: MessageBus,
@@ -60,6 +171,7 @@ class Pod(EventProcessor):
         """
         super().__init__(message_bus, pod_id)
         self.pod_id = pod_id
+        self._movement_watcher = None
         self.status = PodStatus.IDLE
         self._available_requests = []
         self.decision: Optional[Decision] = None
@@ -485,15 +597,43 @@ class Pod(EventProcessor):
         await self.publish_event(event)
 
     async def update(self, dt: float) -> bool:
-        """Update pod physics for time step dt
+        """Update pod physics for time step dt and publish the outcome"""
+        result = self.advance(dt)
+        position_update = await self.resolve_movement(result)
+        if position_update is not None:
+            # Publish exactly one position update per physics tick
+            # This gives the UI the final resolved position after all internal edge transitions
+            await self.publish_event(position_update)
+        return result in (MovementResult.COMPLETED, MovementResult.STOPPED)
+
+    async def resolve_movement(self, result: MovementResult) -> PodPositionUpdate | None:
+        """Act on an advance() result; returns the position update to publish, if any
+
+        Route completion is handled here. Position updates are returned rather
+        than published so bulk callers can batch them.
+        """
+        if result is MovementResult.COMPLETED:
+            await self._handle_route_completion()
+        elif result is MovementResult.MOVED:
+            return self._position_update_event()
+        return None
+
+    def watch_movement(self, callback) -> None:
+        """Call callback() whenever status, segment, progress or speed is assigned"""
+        self._movement_watcher = callback
+
+    def advance(self, dt: float) -> MovementResult:
+        """Advance pod physics for time step dt without publishing anything
 
         Implements Continuous Path Integration:
         - Consumes distance from current segment
         - Overflows to next segment in queue if dt > remaining length
         - Handles precise position interpolation
+
+        Must run inside the event loop: station arrivals are scheduled as tasks.
         """
         if self.status != PodStatus.EN_ROUTE or not self.current_segment:
-            return False
+            return MovementResult.IDLE
 
         dist_to_travel = self.speed * dt
         # Safety cap to prevent warping across map in one lag spike (e.g. max 100m/tick)
@@ -502,8 +642,7 @@ class Pod(EventProcessor):
         while dist_to_travel > 0:
             if not self.current_segment:
                 # End of route reached
-                await self._handle_route_completion()
-                return True
+                return MovementResult.COMPLETED
 
             remaining_on_edge = self.current_segment.length - self.segment_progress
 
@@ -526,19 +665,32 @@ class Pod(EventProcessor):
                     # If pod is now loading/unloading, stop movement for this tick
                     # If pod is now loading/unloading, stop movement for this tick
                     if self.status in [PodStatus.LOADING, PodStatus.UNLOADING]:
-                        return True
+                        return MovementResult.STOPPED
             else:
                 # Normal case: Move along current edge
                 self.segment_progress += dist_to_travel
                 dist_to_travel = 0
 
+        if not self.current_segment:
+            # Tick ended exactly on the final node; complete now or the pod stalls en route
+            return MovementResult.COMPLETED
+
         # Update observable location state
         self._update_location_descriptor()
+        return MovementResult.MOVED
 
-        # Publish exactly one position update per physics tick
-        # This gives the UI the final resolved position after all internal edge transitions
-        await self._publish_position_update()
-        return False
+    def place_on_edge(self, progress: float, x: float, y: float) -> None:
+        """Set progress and position on the current segment from PodPool's columns
+
+        Skips the movement watcher: the pool already holds these values.
+        """
+        self.__dict__["segment_progress"] = progress
+        self.location_descriptor = LocationDescriptor(
+            location_type="edge",
+            edge_id=self.current_segment.segment_id,
+            coordinate=Coordinate(x, y),
+            distance_on_edge=progress,
+        )
 
     def _advance_segment(self):
         """Move to next segment in queue"""
@@ -701,14 +853,18 @@ class Pod(EventProcessor):
 
     async def _publish_position_update(self):
         """Publish real-time position update for UI streaming"""
-        event = PodPositionUpdate(
+        await self.publish_event(self._position_update_event())
+
+    def _position_update_event(self) -> PodPositionUpdate:
+        """Build the position update event for the current physics state"""
+        return PodPositionUpdate(
             pod_id=self.pod_id,
             location=self.location_descriptor,
             status=self.status.value,
             speed=self.speed if self.status == PodStatus.EN_ROUTE else 0.0,
-            current_route=self.current_route.stations if self.current_route else None
+            current_route=self.current_route.stations if self.current_route else None,
+            source=self.component_id,
         )
-        await self.publish_event(event)
 
     def _get_capacity_status(self):
         """Return (cap_used, cap_total, weight_used, weight_total)"""
@@ -756,10 +912,23 @@ class PassengerPod(Pod):
     ):
         super().__init__(message_bus, pod_id, routing_provider, stations)
         self.capacity = 4  # Seats
-        self.passengers = []  # List[dict] with passenger_id, destination
+        self._passengers = PayloadList(key="passenger_id")  # passenger_id, destination
         self.pickup_route = []  # Stations to pick up from, in order
         self.delivery_route = []  # Stations to deliver to, in order
 
+    @property
+    def passengers(self) -> PayloadList:
+        return self._passengers
+
+    @passengers.setter
+    def passengers(self, value):
+        """Replace contents in place so existing references stay attached"""
+        self._passengers[:] = value
+
+    def has_passenger(self, passenger_id: str) -> bool:
+        """Check whether a passenger is on board"""
+        return self._passengers.contains_id(passenger_id)
+
     def _get_pod_type(self) -> PodType:
         """Return passenger pod type"""
         return PodType.PASSENGER
@@ -803,7 +972,7 @@ class PassengerPod(Pod):
                 passenger_id = p.get("passenger_id")
                 
                 # ADVERSARIAL FIX: check if passenger already somehow on board (Zombie check)
-                if any(existing.get("passenger_id") == passenger_id for existing in self.passengers):
+                if self.has_passenger(passenger_id):
                     logger.warning(
                         f"Pod {self.pod_id}: Passenger {passenger_id} already on board! Skipping duplicate pickup.")
                     continue
@@ -975,10 +1144,23 @@ class CargoPod(Pod):
         super().__init__(message_bus, pod_id, routing_provider, stations)
         self.weight_capacity = 500.0  # kg
         self.current_weight = 0.0
-        self.cargo = []  # List[dict] with request_id, destination, weight
+        self._cargo = PayloadList(key="request_id")  # request_id, destination, weight
         self.pickup_route = []  # Stations to pick up cargo from
         self.delivery_route = []  # Stations to deliver cargo to
 
+    @property
+    def cargo(self) -> PayloadList:
+        return self._cargo
+
+    @cargo.setter
+    def cargo(self, value):
+        """Replace contents in place so existing references stay attached"""
+        self._cargo[:] = value
+
+    def has_cargo(self, request_id: str) -> bool:
+        """Check whether a cargo item is on board"""
+        return self._cargo.contains_id(request_id)
+
     def _get_pod_type(self) -> PodType:
         """Return cargo pod type"""
         return PodType.CARGO
@@ -6,15 +6,18 @@ import random
 from datetime import datetime, UTC
 from typing import Any, Mapping
 
+import orjson
+
 from .ai_provider import AIProviderFactory
 from .errors import handle_exception
-from .message_bus import LocalMessageBus, MessageBus
+from .message_bus import LocalMessageBus, MessageBus, StreamMessageBus
 from .model import SystemSnapshot
 from .network import (
     NetworkContext,
     load_network_data,
 )
-from .pod import CargoPod, PassengerPod, Pod
+from .pod import CargoPod, MovementResult, PassengerPod, Pod, PodType
+from .pod_pool import PodPool
 from .routing import RoutingProvider
 from .station import CargoGenerator, PassengerGenerator, Station
 
@@ -132,6 +135,27 @@ class SystemContext:
 
         return cls._instance
 
+    @classmethod
+    def initialize_from_config(cls, config: AexisConfig) -> 'SystemContext':
+        """Initialize SystemContext from an in-memory AexisConfig (no config file)"""
+        if cls._instance is None:
+            if cls._lock is None:
+                import threading
+                cls._lock = threading.Lock()
+
+            with cls._lock:
+                if cls._instance is None:
+                    instance = cls()
+                    instance._apply_configuration(config)
+                    cls._instance = instance
+
+        return cls._instance
+
+    @classmethod
+    def initialize_from_dict(cls, config_data: dict[str, Any]) -> 'SystemContext':
+        """Initialize SystemContext from already-parsed aexis.json data"""
+        return cls.initialize_from_config(cls._config_from_dict(config_data))
+
     @classmethod
     def set_instance(cls, instance: 'SystemContext'):
         """Set the SystemContext instance (for testing)"""
@@ -146,23 +170,7 @@ class SystemContext:
             with open(config_path, 'r') as f:
                 config_data = json.load(f)
 
-            # Extract configuration section
-            config_section = config_data.get('config', {})
-
-            # Initialize AexisConfig with loaded data
-            self._config = AexisConfig(
-                debug=config_section.get('debug', False),
-                network_data_path=config_section.get(
-                    'networkDataPath', 'network.json'),
-                **{k: v for k, v in config_section.items() if k not in ['debug', 'networkDataPath']}
-            )
-
-            # Load network data and initialize NetworkContext
-            network_path = self._config.network_data_path
-            logger.warning(f"Loading network data from {network_path}")
-            network_data = load_network_data(network_path)
-            self._network_context = NetworkContext(network_data)
-            NetworkContext.set_instance(self._network_context)
+            self._apply_configuration(self._config_from_dict(config_data))
 
             logger.warning(
                 f"SystemContext initialized with config: {config_path}")
@@ -179,6 +187,30 @@ class SystemContext:
             self._config = AexisConfig()
             self._network_context = NetworkContext()
 
+    @staticmethod
+    def _config_from_dict(config_data: dict[str, Any]) -> AexisConfig:
+        """Build an AexisConfig from the aexis.json document structure"""
+        # Extract configuration section
+        config_section = config_data.get('config', {})
+
+        return AexisConfig(
+            debug=config_section.get('debug', False),
+            network_data_path=config_section.get(
+                'networkDataPath', 'network.json'),
+            **{k: v for k, v in config_section.items() if k not in ['debug', 'networkDataPath']}
+        )
+
+    def _apply_configuration(self, config: AexisConfig):
+        """Adopt an AexisConfig and load the network it points to"""
+        self._config = config
+
+        # Load network data and initialize NetworkContext
+        network_path = self._config.network_data_path
+        logger.warning(f"Loading network data from {network_path}")
+        network_data = load_network_data(network_path) if network_path else None
+        self._network_context = NetworkContext(network_data)
+        NetworkContext.set_instance(self._network_context)
+
     def get_config(self) -> AexisConfig:
         """Get system configuration"""
         if self._config is None:
@@ -229,6 +261,14 @@ class AexisSystem:
             redis_url = self.config.get('redis.url', "redis://localhost:6379")
             if redis_url == "local://":
                 self.message_bus = LocalMessageBus()
+            elif self.config.get('redis.transport', "pubsub") == "streams":
+                self.message_bus = StreamMessageBus(
+                    redis_url=redis_url,
+                    password=self.config.get('redis.password'),
+                    # Stable per-service group so a restart resumes where it left off
+                    group=self.config.get('redis.streamGroup', "aexis-core"),
+                    maxlen=self.config.get('redis.streamMaxlen', StreamMessageBus.DEFAULT_MAXLEN),
+                )
             else:
                 self.message_bus = MessageBus(
                     redis_url=redis_url,
@@ -236,6 +276,9 @@ class AexisSystem:
                 )
         self.ai_provider = None
         self.pods: Mapping[str, Pod] = {}
+        self.pods_by_type: dict[PodType, list[Pod]] = {t: [] for t in PodType}
+        # Vectorized physics for large fleets (None: per-pod updates)
+        self.pod_pool: PodPool | None = None
         self.stations = {}
         self.passenger_generator = None
         self.cargo_generator = None
@@ -263,6 +306,8 @@ class AexisSystem:
         self.station_count = self.config.get('stations.count', 8)
         self.snapshot_interval = self.config.get(
             'system.snapshotInterval', 300)  # 5 minutes
+        self.state_publish_interval = self.config.get(
+            'system.statePublishInterval', 2.0)  # seconds
 
     async def initialize(self) -> bool:
         """Initialize system"""
@@ -281,6 +326,7 @@ class AexisSystem:
 
             # Create pods
             await self._create_pods()
+            self._build_pod_pool()
 
             # Setup generators
             await self._setup_generators()
@@ -477,6 +523,9 @@ class AexisSystem:
         # Start system monitoring
         monitor_task = asyncio.create_task(self._system_monitor())
 
+        # Push full system state to dashboards
+        state_task = asyncio.create_task(self._state_publisher())
+
         # Start periodic decision making
         decision_task = asyncio.create_task(self._periodic_decision_making())
 
@@ -496,6 +545,7 @@ class AexisSystem:
                 *pod_tasks,
                 # *generator_tasks,
                 monitor_task,
+                state_task,
                 decision_task,
                 movement_task,
                 return_exceptions=True,
@@ -690,6 +740,7 @@ class AexisSystem:
             )
 
             self.pods[pod_id] = pod
+            self.pods_by_type[pod.pod_type].append(pod)
             pod_type = "Cargo" if is_cargo else "Passenger"
 
             logger.info(
@@ -872,6 +923,35 @@ class AexisSystem:
         for pod in self.pods.values():
             await pod.update(dt)
 
+    def _build_pod_pool(self):
+        """Switch to vectorized pod physics when NumPy is present and the fleet is large"""
+        if PodPool.available() and len(self.pods) >= PodPool.MIN_PODS:
+            self.pod_pool = PodPool(list(self.pods.values()))
+            logger.info(f"Vectorized pod physics enabled for {len(self.pods)} pods")
+
+    def _advance_all_pods(self, dt: float) -> list[tuple[Pod, MovementResult]]:
+        """Advance every pod's physics in one synchronous pass"""
+        if self.pod_pool is not None:
+            return self.pod_pool.advance(dt)
+        return [(pod, pod.advance(dt)) for pod in self.pods.values()]
+
+    async def _simulate_pods_bulk(self, dt: float):
+        """Single simulation step that publishes position updates as one batch"""
+        await self._emit_events_bulk(self._advance_all_pods(dt))
+
+    async def _emit_events_bulk(self, results: list[tuple[Pod, MovementResult]]):
+        """Publish the outcome of a bulk physics step"""
+        position_updates = []
+        for pod, result in results:
+            position_update = await pod.resolve_movement(result)
+            if position_update is not None:
+                position_updates.append(position_update)
+
+        if position_updates:
+            await self.message_bus.publish_batch(
+                MessageBus.CHANNELS["POD_EVENTS"], position_updates
+            )
+
     async def _simulate_pod_movement(self):
         """Simulate pod movement with continuous path integration
 
@@ -892,9 +972,12 @@ class AexisSystem:
                 dt = min(dt, 1.0)
 
                 # Update all pods
-                # In Phase 2, this could be parallelized if pod count > 1000
-                for pod in self.pods.values():
-                    await pod.update(dt)
+                if self.pod_pool is not None:
+                    # Large fleet: one vectorized step, one batched publish
+                    await self._simulate_pods_bulk(dt)
+                else:
+                    for pod in self.pods.values():
+                        await pod.update(dt)
 
                 # Sleep strict remainder to maintain roughly target rate
                 # processing_time = loop.time() - now
@@ -995,6 +1078,29 @@ class AexisSystem:
             MessageBus.get_event_channel(snapshot.event_type), snapshot
         )
 
+    async def _state_publisher(self):
+        """Push system state so dashboards don't have to poll the API"""
+        while self.running:
+            try:
+                await self._publish_system_state()
+            except Exception as e:
+                logger.debug(f"State publisher error: {e}", exc_info=True)
+            await asyncio.sleep(self.state_publish_interval)
+
+    async def _publish_system_state(self):
+        """Publish get_system_state() on the SYSTEM_STATE pub/sub channel
+
+        Snapshots go straight over pub/sub whatever the bus transport: they are
+        superseded every interval, so a stream would only pile up stale copies.
+        """
+        client = self.message_bus.redis_client
+        if client is None:
+            # Local bus: no out-of-process dashboard to feed
+            return
+        await client.publish(
+            MessageBus.CHANNELS["SYSTEM_STATE"], orjson.dumps(self.get_system_state())
+        )
+
     async def _log_system_status(self):
         """Log system status"""
         logger.info(
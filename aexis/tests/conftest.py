@@ -8,11 +8,48 @@ sys.path.append(
 )
 
 import asyncio
+import functools
+from pathlib import Path
 
+import orjson
 import pytest
+import pytest_asyncio
 from aexis.core.system import AexisSystem
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="profile @pytest.mark.profile tests with pyinstrument (HTML in prof/)",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Wrap opted-in tests in a pyinstrument profiler when --profile is given"""
+    if not (item.config.getoption("--profile") and item.get_closest_marker("profile")):
+        yield
+        return
+
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        raise pytest.UsageError("--profile requires pyinstrument (pip install pyinstrument)")
+
+    profiler = Profiler()
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        out_dir = Path(item.config.rootpath) / "prof"
+        out_dir.mkdir(exist_ok=True)
+        name = "".join(c if c.isalnum() or c in "-_." else "_" for c in item.nodeid)
+        (out_dir / f"{name}.html").write_text(profiler.output_html())
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for each test case."""
@@ -21,6 +58,62 @@ def event_loop():
     loop.close()
 
 
+@functools.lru_cache(maxsize=None)
+def load_network_json(path: str) -> dict:
+    """Parse a network JSON file once per session (treat the result as read-only)"""
+    return orjson.loads(Path(path).read_bytes())
+
+
+@pytest.fixture(scope="session")
+def load_network():
+    """Cached network.json loader shared across test modules"""
+    return lambda path: load_network_json(str(path))
+
+
+@pytest.fixture(scope="module")
+def fake_redis():
+    """Route redis.asyncio.from_url to an in-process fakeredis server"""
+    fakeredis = pytest.importorskip("fakeredis")
+    import redis.asyncio
+
+    server = fakeredis.FakeServer()
+
+    def from_url(url, **kwargs):
+        return fakeredis.FakeAsyncRedis(
+            server=server, decode_responses=kwargs.get("decode_responses", False)
+        )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(redis.asyncio, "from_url", from_url)
+        yield server
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def redis_pool(request):
+    """Connection pool shared by every MessageBus in a module
+
+    Backed by fakeredis unless REDIS_URL points at a live server. Tests flush
+    the selected database, so REDIS_URL must name a disposable one.
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        from aexis.core.message_bus import MessageBus
+
+        pool = MessageBus.create_connection_pool(redis_url)
+    else:
+        from fakeredis.aioredis import FakeAsyncRedisConnection
+        import redis.asyncio
+
+        pool = redis.asyncio.ConnectionPool(
+            connection_class=FakeAsyncRedisConnection,
+            server=request.getfixturevalue("fake_redis"),
+            max_connections=32,
+            decode_responses=True,
+        )
+    yield pool
+    await pool.aclose()
+
+
 def load_env():
     """Simple .env loader"""
     env_path = os.path.join(
@@ -12,7 +12,6 @@ Tests verify system robustness against:
 """
 
 import asyncio
-import json
 import pytest
 import logging
 from pathlib import Path
@@ -44,7 +43,7 @@ def network_path():
 
 
 @pytest.fixture
-def aexis_system_adversarial(local_message_bus, network_path):
+def aexis_system_adversarial(local_message_bus, network_path, load_network):
     """System with configurable pod count for stress testing"""
     config = AexisConfig(
         debug=True,
@@ -59,8 +58,7 @@ def aexis_system_adversarial(local_message_bus, network_path):
     mock_ctx.get_config.return_value = config
     
     NetworkContext._instance = None
-    with open(str(network_path), 'r') as f:
-        network_data = json.load(f)
+    network_data = load_network(network_path)
     real_network = NetworkContext(network_data=network_data)
     NetworkContext._instance = real_network
     mock_ctx.get_network_context.return_value = real_network
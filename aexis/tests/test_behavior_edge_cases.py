@@ -9,7 +9,6 @@ Tests verify:
 """
 
 import asyncio
-import json
 import pytest
 from pathlib import Path
 from datetime import datetime, UTC
@@ -34,7 +33,7 @@ def network_path():
 
 
 @pytest.fixture
-def aexis_system_two_pods(local_message_bus, network_path, mocker):
+def aexis_system_two_pods(local_message_bus, network_path, load_network, mocker):
     """System with 2 passenger pods for conflict testing"""
     config = AexisConfig(
         debug=True,
@@ -49,8 +48,7 @@ def aexis_system_two_pods(local_message_bus, network_path, mocker):
     mock_ctx.get_config.return_value = config
     
     NetworkContext._instance = None
-    with open(str(network_path), 'r') as f:
-        network_data = json.load(f)
+    network_data = load_network(network_path)
     real_network = NetworkContext(network_data=network_data)
     NetworkContext._instance = real_network
     mock_ctx.get_network_context.return_value = real_network
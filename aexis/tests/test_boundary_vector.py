@@ -10,7 +10,6 @@ Tests verify system behavior at resource limits and edge cases:
 """
 
 import asyncio
-import json
 import pytest
 import pytest_asyncio
 import logging
@@ -43,7 +42,7 @@ def network_path():
 
 
 @pytest_asyncio.fixture
-async def boundary_system(local_message_bus, network_path):
+async def boundary_system(local_message_bus, network_path, load_network):
     """System configured for boundary testing"""
     config = AexisConfig(
         debug=True,
@@ -58,8 +57,7 @@ async def boundary_system(local_message_bus, network_path):
     mock_ctx.get_config.return_value = config
     
     NetworkContext._instance = None
-    with open(str(network_path), 'r') as f:
-        network_data = json.load(f)
+    network_data = load_network(network_path)
     real_network = NetworkContext(network_data=network_data)
     NetworkContext._instance = real_network
     mock_ctx.get_network_context.return_value = real_network
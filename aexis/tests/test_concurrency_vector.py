@@ -10,7 +10,6 @@ Tests verify system behavior under concurrent operations:
 """
 
 import asyncio
-import json
 import pytest
 import logging
 from pathlib import Path
@@ -46,7 +45,7 @@ import pytest_asyncio
 
 
 @pytest_asyncio.fixture
-async def concurrent_system(local_message_bus, network_path):
+async def concurrent_system(local_message_bus, network_path, load_network):
     """System configured for concurrency testing with many pods"""
     config = AexisConfig(
         debug=True,
@@ -61,8 +60,7 @@ async def concurrent_system(local_message_bus, network_path):
     mock_ctx.get_config.return_value = config
     
     NetworkContext._instance = None
-    with open(str(network_path), 'r') as f:
-        network_data = json.load(f)
+    network_data = load_network(network_path)
     real_network = NetworkContext(network_data=network_data)
     NetworkContext._instance = real_network
     mock_ctx.get_network_context.return_value = real_network
@@ -0,0 +1,326 @@
+"""
+Unit tests for the web dashboard: state deltas and Redis forwarding
+"""
+
+import asyncio
+import copy
+import os
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from aexis.web.dashboard import NoCacheStaticFiles, WebDashboard, _state_delta
+
+
+def merge_state_delta(state: dict, delta: dict, removed: list) -> dict:
+    """Python mirror of mergeStateDelta in static/src/app.ts"""
+    for key, value in delta.items():
+        current = state.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            state[key] = {**current, **value}
+        else:
+            state[key] = value
+    for path in removed:
+        if len(path) == 1:
+            state.pop(path[0], None)
+        elif isinstance(state.get(path[0]), dict):
+            state[path[0]].pop(path[1], None)
+    return state
+
+
+BASE_STATE = {
+    "timestamp": "2026-01-01T00:00:00",
+    "uptime_seconds": 10,
+    "running": True,
+    "metrics": {"active_pods": 2, "pending_passengers": 5},
+    "pods": {
+        "pod_001": {"status": "idle", "location": {"node_id": "station_001"}},
+        "pod_002": {"status": "en_route", "location": {"node_id": ""}},
+    },
+    "stations": {"station_001": {"queue": 3}},
+}
+
+
+def evolve(**changes) -> dict:
+    state = copy.deepcopy(BASE_STATE)
+    state["timestamp"] = "2026-01-01T00:00:02"
+    state["uptime_seconds"] = 12
+    state.update(changes)
+    return state
+
+
+def test_state_delta_only_volatile_changes_is_empty():
+    assert _state_delta(BASE_STATE, evolve()) == ({}, [])
+
+
+def test_state_delta_added_and_changed_keys():
+    current = evolve(running=False, network={"edges": 4})
+    current["metrics"] = {**BASE_STATE["metrics"], "active_pods": 3, "fallback": 0}
+
+    changed, removed = _state_delta(BASE_STATE, current)
+    assert changed == {
+        "running": False,
+        "network": {"edges": 4},
+        "metrics": {"active_pods": 3, "fallback": 0},
+        "timestamp": current["timestamp"],
+        "uptime_seconds": current["uptime_seconds"],
+    }
+    assert removed == []
+
+
+def test_state_delta_removed_keys():
+    current = evolve()
+    del current["stations"]
+    del current["pods"]["pod_002"]
+
+    changed, removed = _state_delta(BASE_STATE, current)
+    assert sorted(removed) == [["pods", "pod_002"], ["stations"]]
+    # Removal alone still carries the volatile keys so clients stay current
+    assert changed == {
+        "timestamp": current["timestamp"],
+        "uptime_seconds": current["uptime_seconds"],
+    }
+
+
+def test_state_delta_nested_dicts_replace_changed_entry():
+    current = evolve()
+    current["pods"]["pod_002"] = {"status": "idle", "location": {"node_id": "station_004"}}
+
+    changed, removed = _state_delta(BASE_STATE, current)
+    # Diffing stops one level down: the changed pod is sent whole
+    assert changed["pods"] == {"pod_002": current["pods"]["pod_002"]}
+    assert removed == []
+
+
+def test_state_delta_none_entry_is_not_missing():
+    previous = {"pods": {"pod_001": None}}
+    current = {"pods": {}}
+    assert _state_delta(previous, current) == ({}, [["pods", "pod_001"]])
+    assert _state_delta(current, previous)[0] == {"pods": {"pod_001": None}}
+    assert _state_delta({"running": True}, {"running": True, "current_route": None}) == (
+        {"current_route": None},
+        [],
+    )
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda s: s.update(running=False),
+        lambda s: s["metrics"].update(active_pods=7),
+        lambda s: s["pods"].update(pod_003={"status": "idle"}),
+        lambda s: s["pods"].pop("pod_001"),
+        lambda s: s.pop("stations"),
+        lambda s: s["pods"]["pod_002"]["location"].update(node_id="station_009"),
+        lambda s: s.update(metrics=None),
+        lambda s: s.update(current_route=None),
+    ],
+    ids=[
+        "top-level", "nested", "added", "removed-entry", "removed-key", "deep",
+        "type-change", "added-none",
+    ],
+)
+def test_state_delta_round_trip(mutate):
+    current = evolve()
+    mutate(current)
+
+    changed, removed = _state_delta(BASE_STATE, current)
+    assert merge_state_delta(copy.deepcopy(BASE_STATE), changed, removed) == current
+
+
+@pytest.mark.asyncio
+async def test_redis_listener_backoff_resets_after_connect(monkeypatch):
+    """
+    The Redis listener retries instead of exiting: the delay doubles per failed
+    attempt and starts over once a connection has been made.
+    """
+    dashboard = WebDashboard()
+    outcomes = iter(["fail", "fail", "fail", "drop", "fail", "stop"])
+    delays = []
+
+    async def fake_forward():
+        outcome = next(outcomes)
+        if outcome == "fail":
+            raise ConnectionError("redis down")
+        if outcome == "drop":
+            # Connected, then the connection ended
+            dashboard._redis_connects += 1
+            return
+        dashboard._redis_running = False
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(dashboard, "_forward_redis_events", fake_forward)
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    await dashboard.start_redis_listener()
+    assert delays == [1.0, 2.0, 4.0, 1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_redis_listener_backoff_is_capped(monkeypatch):
+    """
+    Repeated failures never wait longer than RECONNECT_MAX_DELAY.
+    """
+    dashboard = WebDashboard()
+    delays = []
+
+    async def fake_forward():
+        raise ConnectionError("redis down")
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        if len(delays) == 8:
+            dashboard._redis_running = False
+
+    monkeypatch.setattr(dashboard, "_forward_redis_events", fake_forward)
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    await dashboard.start_redis_listener()
+    assert delays == [1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 60.0, 60.0]
+
+
+# --- Static assets ---
+
+@pytest.fixture
+def static_app(tmp_path):
+    """NoCacheStaticFiles over a temp dir, plus an httpx client for it"""
+    static = NoCacheStaticFiles(directory=tmp_path)
+    app = Starlette(routes=[Mount("/static", static)])
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+    return static, client
+
+
+def write_asset(path, body: bytes, mtime_ns: int):
+    path.write_bytes(body)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.mark.asyncio
+async def test_static_asset_cache_follows_mtime(static_app, tmp_path):
+    """
+    Small assets are served from memory; a new mtime reads the file again.
+    """
+    static, client = static_app
+    static.STAT_TTL = 0.0
+    asset = tmp_path / "app.js"
+
+    write_asset(asset, b"one", 1_000_000_000)
+    response = await client.get("/static/app.js")
+    assert response.content == b"one"
+    assert response.headers["cache-control"] == "no-cache, no-store, must-revalidate"
+
+    # Same mtime: the cached bytes are reused even though the file changed
+    write_asset(asset, b"two", 1_000_000_000)
+    assert (await client.get("/static/app.js")).content == b"one"
+
+    write_asset(asset, b"two", 2_000_000_000)
+    assert (await client.get("/static/app.js")).content == b"two"
+
+
+@pytest.mark.asyncio
+async def test_static_stat_is_reused_within_ttl(static_app, tmp_path, monkeypatch):
+    """
+    Within STAT_TTL the path is not looked up on disk again.
+    """
+    static, client = static_app
+    write_asset(tmp_path / "style.css", b"body{}", 1_000_000_000)
+    lookups = []
+    lookup_path = static.lookup_path
+
+    def counting_lookup(path):
+        lookups.append(path)
+        return lookup_path(path)
+
+    monkeypatch.setattr(static, "lookup_path", counting_lookup)
+    for _ in range(3):
+        assert (await client.get("/static/style.css")).status_code == 200
+    assert lookups == ["style.css"]
+
+
+@pytest.mark.asyncio
+async def test_static_deleted_asset_with_stale_stat_is_404(static_app, tmp_path):
+    """
+    A file deleted while its stat is still cached answers 404, not 500.
+    """
+    static, client = static_app
+    asset = tmp_path / "old.js"
+    write_asset(asset, b"gone soon", 1_000_000_000)
+    # Stat is cached but the bytes were never read, so the request must open the file
+    await static._cached_lookup("old.js")
+    asset.unlink()
+
+    assert (await client.get("/static/old.js")).status_code == 404
+    assert "old.js" not in static._stats
+
+
+@pytest.mark.asyncio
+async def test_index_follows_mtime(tmp_path):
+    """
+    The SPA shell is cached per mtime, so an edited index.html is served
+    without restarting the dashboard.
+    """
+    dashboard = WebDashboard()
+    index = tmp_path / "index.html"
+    dashboard._index_path = str(index)
+    transport = httpx.ASGITransport(app=dashboard.get_app())
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        write_asset(index, b"<p>v1</p>", 1_000_000_000)
+        response = await client.get("/")
+        assert response.content == b"<p>v1</p>"
+        assert response.headers["content-type"].startswith("text/html")
+
+        write_asset(index, b"<p>v2</p>", 2_000_000_000)
+        assert (await client.get("/")).content == b"<p>v2</p>"
+
+
+class FakeSocket:
+    """Minimal WebSocket stand-in recording sends and closes"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.sent = []
+        self.closed_with = None
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("send failed")
+        self.sent.append(text)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+@pytest.mark.asyncio
+async def test_broadcast_closes_dropped_clients():
+    """
+    A client whose send fails is removed and closed, so its browser sees the
+    close and reconnects instead of silently missing broadcasts.
+    """
+    dashboard = WebDashboard()
+    healthy, broken = FakeSocket(), FakeSocket(fail=True)
+    dashboard.websocket_connections = {healthy, broken}
+
+    await dashboard.broadcast({"type": "event"})
+
+    assert dashboard.websocket_connections == {healthy}
+    assert healthy.sent and healthy.closed_with is None
+    assert broken.closed_with == 1011
+
+
+@pytest.mark.asyncio
+async def test_static_range_request_bypasses_memory(static_app, tmp_path):
+    """
+    Range requests go to StaticFiles so they get a 206 partial response.
+    """
+    static, client = static_app
+    write_asset(tmp_path / "data.txt", b"0123456789", 1_000_000_000)
+    assert (await client.get("/static/data.txt")).status_code == 200
+
+    response = await client.get("/static/data.txt", headers={"Range": "bytes=2-4"})
+    assert response.status_code == 206
+    assert response.content == b"234"
@@ -2,8 +2,6 @@ import asyncio
 import logging
 import pytest
 import pytest_asyncio
-import json
-import os
 from pathlib import Path
 from datetime import datetime, UTC
 from aexis.core.system import AexisSystem, SystemContext, AexisConfig
@@ -37,38 +35,22 @@ async def system_instance():
         base_dir = Path(__file__).resolve().parent.parent
         network_path = base_dir / "network.json"
         
-        # Create temp config for isolation
-        temp_config = "/tmp/aexis_lifecycle_test_config.json"
-        config_data = {
-            "config": {
-                "debug": False,
-                "networkDataPath": str(network_path),
-                "redis": {
-                    "url": "local://"
-                },
-                "ai": {
-                    "provider": "mock"
-                },
-                "pods": {
-                    "count": 4,
-                    "cargoRatio": 0.5,
-                    "cargoPercentage": 50
-                },
-                "stations": {
-                    "count": 21
-                },
-                "system": {
-                    "snapshotInterval": 300,
-                    "decisionInterval": 30,
-                    "monitoringInterval": 60
-                }
+        # Build config in memory for isolation
+        config = AexisConfig(
+            debug=False,
+            network_data_path=str(network_path),
+            redis={"url": "local://"},
+            ai={"provider": "mock"},
+            pods={"count": 4, "cargoRatio": 0.5, "cargoPercentage": 50},
+            stations={"count": 21},
+            system={
+                "snapshotInterval": 300,
+                "decisionInterval": 30,
+                "monitoringInterval": 60
             }
-        }
-        
-        with open(temp_config, "w") as f:
-            json.dump(config_data, f)
-            
-        system_context = SystemContext.initialize_sync(config_path=temp_config)
+        )
+
+        system_context = SystemContext.initialize_from_config(config)
         aexis_system = AexisSystem(system_context=system_context)
         
         # Initialize system components
@@ -78,11 +60,11 @@ async def system_instance():
         aexis_system.running = True
         asyncio.create_task(aexis_system.message_bus.start_listening())
         
-        # Start all stations and pods
-        for station in aexis_system.stations.values():
-            await station.start()
-        for pod in aexis_system.pods.values():
-            await pod.start()
+        # Start all stations and pods concurrently
+        await asyncio.gather(
+            *[station.start() for station in aexis_system.stations.values()],
+            *[pod.start() for pod in aexis_system.pods.values()],
+        )
             
         # Setup subscriptions for reactive behavior (normally done in system.start())
         await aexis_system._setup_subscriptions()
@@ -94,9 +76,8 @@ async def system_instance():
         
         # Cleanup
         await aexis_system.shutdown()
-        if os.path.exists(temp_config):
-            os.remove(temp_config)
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_passenger_pickup_lifecycle(system_instance):
     """
@@ -107,7 +88,7 @@ async def test_passenger_pickup_lifecycle(system_instance):
     passenger_id = "p_lifecycle_001"
     
     # 1. Find a passenger pod
-    pod = next(p for p in system_instance.pods.values() if p.pod_type == PodType.PASSENGER)
+    pod = system_instance.pods_by_type[PodType.PASSENGER][0]
     
     # 2. Place pod at origin
     station_obj = system_instance.stations[origin]
@@ -136,7 +117,7 @@ async def test_passenger_pickup_lifecycle(system_instance):
     success = False
     for _ in range(max_retries):
         await system_instance._simulate_pod_movement_once(1.0)
-        if any(p["passenger_id"] == passenger_id for p in pod.passengers):
+        if pod.has_passenger(passenger_id):
             success = True
             break
         await asyncio.sleep(0.01)
@@ -169,8 +150,9 @@ async def test_passenger_pickup_lifecycle(system_instance):
         await asyncio.sleep(0.005)
         
     assert arrived, "Pod failed to reach delivery destination"
-    assert not any(p["passenger_id"] == passenger_id for p in pod.passengers), "Passenger should be delivered (unloaded)"
+    assert not pod.has_passenger(passenger_id), "Passenger should be delivered (unloaded)"
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_cargo_weight_limit_lifecycle(system_instance):
     """
@@ -180,7 +162,7 @@ async def test_cargo_weight_limit_lifecycle(system_instance):
     destination = "station_002"
     
     # 1. Find a cargo pod
-    pod = next(p for p in system_instance.pods.values() if p.pod_type == PodType.CARGO)
+    pod = system_instance.pods_by_type[PodType.CARGO][0]
     pod.max_weight = 500.0 # Standard
     
     # 2. Place pod at origin
@@ -212,9 +194,10 @@ async def test_cargo_weight_limit_lifecycle(system_instance):
     for _ in range(10):
         await system_instance._simulate_pod_movement_once(1.0)
         
-    assert not any(c["request_id"] == cargo_id for c in pod.cargo), "Pod should NOT have loaded overweight cargo"
+    assert not pod.has_cargo(cargo_id), "Pod should NOT have loaded overweight cargo"
     assert len(system_instance.stations[origin].cargo_queue) == 1, "Cargo should remain in station queue"
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_multi_stop_payload_persistence(system_instance):
     """
@@ -225,7 +208,7 @@ async def test_multi_stop_payload_persistence(system_instance):
     final = "station_003"
     passenger_id = "p_long_001"
     
-    pod = next(p for p in system_instance.pods.values() if p.pod_type == PodType.PASSENGER)
+    pod = system_instance.pods_by_type[PodType.PASSENGER][0]
     
     # Setup: Pod at origin with passenger already loaded
     pod.location_descriptor.node_id = origin
@@ -248,7 +231,7 @@ async def test_multi_stop_payload_persistence(system_instance):
         if pod.location_descriptor.node_id == intermediate:
             arrived_intermediate = True
             # Check persistence
-            assert any(p["passenger_id"] == passenger_id for p in pod.passengers), "Passenger should still be on board at intermediate stop"
+            assert pod.has_passenger(passenger_id), "Passenger should still be on board at intermediate stop"
             # Pod should remain EN_ROUTE because it hasn't reached final destination
             assert pod.status == PodStatus.EN_ROUTE or pod.segment_progress > 0 or pod.route_queue
             break
@@ -264,4 +247,4 @@ async def test_multi_stop_payload_persistence(system_instance):
             break
             
     assert arrived_final, "Failed to reach final destination"
-    assert not any(p["passenger_id"] == passenger_id for p in pod.passengers), "Passenger should be delivered at final destination"
+    assert not pod.has_passenger(passenger_id), "Passenger should be delivered at final destination"
@@ -0,0 +1,100 @@
+import copy
+import pickle
+from unittest.mock import MagicMock
+
+import pytest
+from aexis.core.pod import CargoPod, PassengerPod, PayloadList
+
+
+def item(item_id):
+    return {"id": item_id}
+
+
+@pytest.fixture
+def payloads():
+    return PayloadList([item("a"), item("b"), item("a")])
+
+
+def test_append_indexes_item(payloads):
+    payloads.append(item("c"))
+    assert payloads.contains_id("c")
+    assert payloads._index == {"a": 2, "b": 1, "c": 1}
+
+
+def test_remove_keeps_duplicate_ids(payloads):
+    payloads.remove(item("a"))
+    assert payloads.contains_id("a")
+    payloads.remove(item("a"))
+    assert not payloads.contains_id("a")
+    assert payloads._index == {"b": 1}
+
+
+def test_extend_and_iadd(payloads):
+    payloads.extend(item(i) for i in ("c", "d"))
+    payloads += [item("e")]
+    assert isinstance(payloads, PayloadList)
+    assert all(payloads.contains_id(i) for i in ("c", "d", "e"))
+
+
+def test_slice_assign_reindexes(payloads):
+    payloads[1:] = [item("x")]
+    assert payloads == [item("a"), item("x")]
+    assert payloads._index == {"a": 1, "x": 1}
+
+    del payloads[0]
+    assert payloads._index == {"x": 1}
+
+
+def test_pop_and_clear(payloads):
+    assert payloads.pop() == item("a")
+    assert payloads._index == {"a": 1, "b": 1}
+    payloads.clear()
+    assert not payloads
+    assert payloads._index == {}
+
+
+@pytest.mark.parametrize("n, expected", [(0, {}), (2, {"a": 4, "b": 2})])
+def test_imul_reindexes(payloads, n, expected):
+    payloads *= n
+    assert isinstance(payloads, PayloadList)
+    assert len(payloads) == 3 * n
+    assert payloads._index == expected
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda p: pickle.loads(pickle.dumps(p))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_copies_rebuild_index(payloads, clone):
+    cloned = clone(payloads)
+    assert isinstance(cloned, PayloadList)
+    assert cloned == payloads
+    assert cloned._index == {"a": 2, "b": 1}
+
+    # The copy's index is its own: emptying it must not touch the original
+    cloned.remove(item("a"))
+    cloned.remove(item("a"))
+    assert not cloned.contains_id("a")
+    assert payloads.contains_id("a")
+
+
+def test_deepcopy_keeps_key():
+    passengers = PayloadList([{"passenger_id": "p1"}], key="passenger_id")
+    assert copy.deepcopy(passengers).contains_id("p1")
+
+
+@pytest.mark.parametrize(
+    "pod_cls, attr, key",
+    [(PassengerPod, "passengers", "passenger_id"), (CargoPod, "cargo", "request_id")],
+)
+def test_pod_setter_keeps_list_identity(pod_cls, attr, key):
+    pod = pod_cls(MagicMock(), "pod_test")
+    held = getattr(pod, attr)
+
+    setattr(pod, attr, [{key: "x1"}])
+    assert getattr(pod, attr) is held
+    assert held.contains_id("x1")
+
+    held.append({key: "x2"})
+    assert getattr(pod, attr).contains_id("x2")
@@ -1,14 +1,7 @@
-import sys
-from unittest.mock import MagicMock
-
-# Mock redis before importing modules that need it
-sys.modules['redis'] = MagicMock()
-sys.modules['redis.asyncio'] = MagicMock()
-
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, patch
-from aexis.core.pod import Pod, PodStatus
+from unittest.mock import AsyncMock, MagicMock, patch
+from aexis.core.pod import MovementResult, Pod, PodStatus
 from aexis.core.model import Coordinate, EdgeSegment, Route, LocationDescriptor, PodPositionUpdate
 
 # Test Helpers
@@ -54,7 +47,8 @@ def mock_network(mocker):
     
     # Patch the NetworkContext.get_instance where it is defined
     mocker.patch('aexis.core.network.NetworkContext.get_instance', return_value=network)
-    return network
+    yield network
+    MockNetworkContext._instance = None
 
 @pytest.fixture
 def mock_bus(mocker):
@@ -108,3 +102,96 @@ async def test_movement_overflow_event_publication(pod, mock_network, mock_bus):
     assert event_obj.location.coordinate.x == 15.0
     
     print("\n✅ Verification Successful: Event published with correct coordinates.")
+
+@pytest.mark.asyncio
+async def test_advance_moves_without_publishing(pod, mock_network, mock_bus):
+    """
+    advance() applies the same physics as update() but leaves publication to the caller.
+    """
+    await pod._hydrate_route(["s1", "s2", "s3"])
+    pod.status = PodStatus.EN_ROUTE
+
+    assert pod.advance(0.75) is MovementResult.MOVED
+    assert pod.current_segment.segment_id == "s2->s3"
+    assert pod.location_descriptor.coordinate.x == 15.0
+    assert mock_bus.publish_event.await_count == 0
+
+    event_obj = pod._position_update_event()
+    assert event_obj.location.coordinate.x == 15.0
+    assert event_obj.source == "pod_test"
+
+@pytest.mark.asyncio
+async def test_pod_pool_matches_scalar_advance(mock_network, mock_bus):
+    """
+    PodPool must land every pod exactly where Pod.advance would, including segment overflow.
+    """
+    pytest.importorskip("numpy")
+    from aexis.core.pod_pool import PodPool
+
+    async def make_pod(pod_id):
+        p = MockPod(mock_bus, pod_id)
+        p._get_capacity_status = MagicMock(return_value=(0,0,0,0))
+        p.speed = 20.0
+        await p._hydrate_route(["s1", "s2", "s3"])
+        p.status = PodStatus.EN_ROUTE
+        return p
+
+    pooled = [await make_pod("pod_a"), await make_pod("pod_b")]
+    scalar = [await make_pod("pod_c"), await make_pod("pod_d")]
+    pooled[1].segment_progress = scalar[1].segment_progress = 8.0  # overflows onto s2->s3
+    pool = PodPool(pooled)
+
+    results = dict((p.pod_id, r) for p, r in pool.advance(0.25))
+    for p in scalar:
+        p.advance(0.25)
+
+    assert results == {"pod_a": MovementResult.MOVED, "pod_b": MovementResult.MOVED}
+    for p, s in zip(pooled, scalar):
+        assert p.current_segment.segment_id == s.current_segment.segment_id
+        assert p.segment_progress == pytest.approx(s.segment_progress)
+        assert p.location_descriptor.coordinate.x == pytest.approx(s.location_descriptor.coordinate.x)
+
+def test_route_is_frozen_so_membership_cannot_go_stale():
+    """
+    Route caches a station set for `in`; reassigning stations must be impossible.
+    """
+    import dataclasses
+
+    route = Route(route_id="r1", stations=["s1", "s2"])
+    assert route.stations == ("s1", "s2")
+    assert "s2" in route and "s3" not in route
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        route.stations = ("s3",)
+    assert "s3" not in route
+
+@pytest.mark.asyncio
+async def test_pod_pool_resyncs_only_changed_pods(mock_network, mock_bus):
+    """
+    PodPool re-reads a pod only after one of its movement attributes is assigned.
+    """
+    pytest.importorskip("numpy")
+    from aexis.core.pod_pool import PodPool
+
+    pods = []
+    for pod_id in ("pod_a", "pod_b"):
+        p = MockPod(mock_bus, pod_id)
+        p._get_capacity_status = MagicMock(return_value=(0,0,0,0))
+        await p._hydrate_route(["s1", "s2", "s3"])
+        p.status = PodStatus.EN_ROUTE
+        pods.append(p)
+    pool = PodPool(pods)
+
+    pool.advance(0.1)
+    assert pool._dirty == set()
+    assert pool.progress.tolist() == pytest.approx([2.0, 2.0])
+
+    pods[1].speed = 40.0
+    assert pool._dirty == {1}
+    pool.advance(0.1)
+    assert pool.progress.tolist() == pytest.approx([4.0, 6.0])
+    assert [p.segment_progress for p in pods] == pytest.approx([4.0, 6.0])
+
+    pods[0].status = PodStatus.LOADING
+    results = pool.advance(0.1)
+    assert [p.pod_id for p, _ in results] == ["pod_b"]
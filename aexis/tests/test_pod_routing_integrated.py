@@ -22,7 +22,7 @@ def network_path():
     return base_dir / "network.json"
 
 @pytest.fixture
-def aexis_system(local_message_bus, network_path, mocker):
+def aexis_system(local_message_bus, network_path, load_network, mocker):
     # Setup real configuration but override specific values for the test
     # AexisConfig.get expects nested structure for dots
     config = AexisConfig(
@@ -40,9 +40,7 @@ def aexis_system(local_message_bus, network_path, mocker):
     
     # Real network context
     NetworkContext._instance = None # Reset singleton
-    import json
-    with open(str(network_path), 'r') as f:
-        network_data = json.load(f)
+    network_data = load_network(network_path)
     real_network = NetworkContext(network_data=network_data)
     NetworkContext._instance = real_network # Essential for components to find it
     mock_ctx.get_network_context.return_value = real_network
@@ -57,6 +55,7 @@ def aexis_system(local_message_bus, network_path, mocker):
     
     return system
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_pod_routing_and_delivery_lifecycle(aexis_system, local_message_bus):
     """
@@ -71,12 +70,12 @@ async def test_pod_routing_and_delivery_lifecycle(aexis_system, local_message_bu
     
     # Start event processors for all stations and the pod
     # This is normally done in aexis_system.start()
-    for station in aexis_system.stations.values():
-        await station.start()
-        
     pod_id = list(aexis_system.pods.keys())[0]
     pod = aexis_system.pods[pod_id]
-    await pod.start()
+    await asyncio.gather(
+        *[station.start() for station in aexis_system.stations.values()],
+        pod.start(),
+    )
     
     # Now that stations have subscribed, subscribe the system
     # This ensures stations process arrival events BEFORE the system triggers decisions
@@ -121,7 +120,7 @@ async def test_pod_routing_and_delivery_lifecycle(aexis_system, local_message_bu
         
         # Verify Route Calculation (triggered by the event!)
         assert pod.current_route is not None, "Pod should have reactively calculated a route"
-        assert origin_station_id in pod.current_route.stations, "Route should include pickup station"
+        assert origin_station_id in pod.current_route, "Route should include pickup station"
         assert pod.status == PodStatus.EN_ROUTE
         
         # 4. Simulate Movement to Pickup
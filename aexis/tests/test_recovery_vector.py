@@ -10,19 +10,19 @@ Tests verify system behavior under failure conditions using REAL Redis integrati
 """
 
 import asyncio
-import json
+import os
 import pytest
 import pytest_asyncio
 import logging
-import time
 from pathlib import Path
 from datetime import datetime, UTC
 from unittest.mock import MagicMock, AsyncMock, patch
 
+import orjson
 import redis.asyncio as redis
 
 from aexis.core.system import AexisSystem, SystemContext, AexisConfig
-from aexis.core.message_bus import MessageBus
+from aexis.core.message_bus import MessageBus, StreamMessageBus
 from aexis.core.network import NetworkContext
 from aexis.core.model import Event, Command
 
@@ -30,34 +30,24 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 logging.getLogger("aexis.core.message_bus").setLevel(logging.DEBUG)
 
-# Constants for real Redis
-REDIS_URL = "redis://:your_redis_password_here@localhost:6379/0"
+# Live Redis for -m integration runs; other tests fall back to fakeredis
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def network_path():
     base_dir = Path(__file__).resolve().parent.parent
     return base_dir / "network.json"
 
-@pytest.fixture
-def clean_redis():
-    """Ensure Redis is clean before/after tests"""
-    import redis as sync_redis
-    r = sync_redis.from_url(REDIS_URL)
-    r.flushdb()
-    yield
-    r.flushdb()
-    r.close()
-
-@pytest_asyncio.fixture
-async def recovery_system(network_path, clean_redis):
-    """System configured with REAL Redis for recovery testing"""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def recovery_system(network_path, load_network, redis_pool):
+    """System configured with a Redis-backed MessageBus (fakeredis) for recovery testing"""
     config = AexisConfig(
         debug=True,
         network_data_path=str(network_path),
         pods={"count": 5, "cargoPercentage": 50},
         stations={"count": 21},
         ai={"provider": "none"},
-        redis={"url": REDIS_URL}  # Use real Redis
+        redis={"url": REDIS_URL}  # Redis-backed bus, served by fakeredis
     )
     
     mock_ctx = MagicMock(spec=SystemContext)
@@ -65,14 +55,14 @@ async def recovery_system(network_path, clean_redis):
     
     # Initialize network context
     NetworkContext._instance = None
-    with open(str(network_path), 'r') as f:
-        network_data = json.load(f)
+    network_data = load_network(network_path)
     real_network = NetworkContext(network_data=network_data)
     NetworkContext._instance = real_network
     mock_ctx.get_network_context.return_value = real_network
     
-    # Create system - will use real MessageBus due to config
-    system = AexisSystem(system_context=mock_ctx)
+    # Create system with a Redis-backed MessageBus on the shared pool
+    bus = MessageBus(redis_url=REDIS_URL, connection_pool=redis_pool)
+    system = AexisSystem(system_context=mock_ctx, message_bus=bus)
     
     # Mock visualizer/metrics to avoid noise
     system._update_metrics = AsyncMock()
@@ -81,28 +71,54 @@ async def recovery_system(network_path, clean_redis):
     
     await system.initialize()
     # Manually start message bus listening since we don't call system.start()
-    await system.message_bus.start_listening()
+    system.running = True
+    listen_task = asyncio.create_task(system.message_bus.start_listening())
+    await asyncio.sleep(0.1)
     yield system
     await system.shutdown()
+    listen_task.cancel()
+    try:
+        await listen_task
+    except asyncio.CancelledError:
+        pass
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="module")
+async def reset_message_bus(recovery_system):
+    """Flush Redis and drop handlers added by the previous test"""
+    bus = recovery_system.message_bus
+    await bus.redis_client.flushdb()
+    subscribers = {channel: list(handlers) for channel, handlers in bus.subscribers.items()}
+    yield
+    for channel in list(bus.subscribers):
+        bus.subscribers[channel] = subscribers.get(channel, [])
+
+async def subscribe_confirmed(bus: MessageBus, channel: str, handler):
+    """Subscribe handler and wait until Redis has registered the channel"""
+    bus.subscribe(channel, handler)
+    # SUBSCRIBE is idempotent; awaiting it here means the server has the
+    # channel before the caller publishes, instead of sleeping on a guess
+    await bus.pubsub.subscribe(channel)
 
 # --- Connection verification ---
 
-@pytest.mark.asyncio
-@pytest.mark.skip
+@pytest.mark.integration
+@pytest.mark.skipif(not os.getenv("REDIS_URL"), reason="REDIS_URL not set")
+@pytest.mark.asyncio(loop_scope="module")
 async def test_real_redis_connection(recovery_system):
     """
-    Verify the system is actually connected to Redis.
+    Verify the system is actually connected to a live Redis server.
     """
     system = recovery_system
     
     assert isinstance(system.message_bus, MessageBus)
     assert system.message_bus.redis_client is not None
     assert await system.message_bus.redis_client.ping() is True
+    info = await system.message_bus.redis_client.info("server")
+    assert "redis_version" in info
 
 # --- Reconnection Tests ---
 
-@pytest.mark.asyncio
-@pytest.mark.skip
+@pytest.mark.asyncio(loop_scope="module")
 async def test_message_persistence_during_processing(recovery_system):
     """
     Verify that messages published to Redis are received by subscribers.
@@ -110,16 +126,16 @@ async def test_message_persistence_during_processing(recovery_system):
     """
     system = recovery_system
     received_events = []
+    done = asyncio.Event()
     
     event_channel = MessageBus.CHANNELS["SYSTEM_EVENTS"]
     
     def handler(data):
-        print(f"DEBUG: Handler received data: {data}")
+        logger.debug("Handler received data: %s", data)
         received_events.append(data)
+        done.set()
     
-    # Remove await for synchronous subscribe method
-    system.message_bus.subscribe(event_channel, handler)
-    await asyncio.sleep(0.5)  # Wait for subscription to propagate
+    await subscribe_confirmed(system.message_bus, event_channel, handler)
     
     # Publish event
     test_event = Event(
@@ -129,20 +145,14 @@ async def test_message_persistence_during_processing(recovery_system):
     )
     await system.message_bus.publish_event(event_channel, test_event)
     
-    # Wait for propagation (real network delay)
-    for _ in range(10):
-        if len(received_events) > 0:
-            break
-        await asyncio.sleep(0.1)
-        
+    await asyncio.wait_for(done.wait(), timeout=2.0)
     assert len(received_events) == 1
     # Check payload content
     received = received_events[0]
     # MessageBus wraps event in "message" key, and event has "data" dict
     assert received["message"]["data"]["test_id"] == "persistence_001"
 
-@pytest.mark.asyncio
-@pytest.mark.skip
+@pytest.mark.asyncio(loop_scope="module")
 async def test_subscriber_recovery_after_error(recovery_system):
     """
     If a subscriber handler raises an exception, the subscription should remain active
@@ -151,39 +161,62 @@ async def test_subscriber_recovery_after_error(recovery_system):
     system = recovery_system
     channel = "ERROR_TEST_CHANNEL"
     received_count = 0
+    delivered = asyncio.Semaphore(0)
     
     def error_prone_handler(data):
         nonlocal received_count
         received_count += 1
+        delivered.release()
         event_data = data.get("message", {}).get("data", {})
         if event_data.get("trigger_error"):
             raise ValueError("Simulated handler crash")
             
-    system.message_bus.subscribe(channel, error_prone_handler)
-    await asyncio.sleep(0.5)
+    await subscribe_confirmed(system.message_bus, channel, error_prone_handler)
     
     # 1. Send normal message
     evt1 = Event(event_type="TEST_ERROR", data={"trigger_error": False, "seq": 1})
     await system.message_bus.publish_event(channel, evt1)
-    await asyncio.sleep(0.2)
+    await asyncio.wait_for(delivered.acquire(), timeout=2.0)
     assert received_count == 1
     
     # 2. Send triggers error - logs error but shouldn't crash loop
     evt2 = Event(event_type="TEST_ERROR", data={"trigger_error": True, "seq": 2})
     await system.message_bus.publish_event(channel, evt2)
-    await asyncio.sleep(0.2)
+    await asyncio.wait_for(delivered.acquire(), timeout=2.0)
     assert received_count == 2
     
     # 3. Send normal message again - should still work
     evt3 = Event(event_type="TEST_ERROR", data={"trigger_error": False, "seq": 3})
     await system.message_bus.publish_event(channel, evt3)
-    await asyncio.sleep(0.2)
+    await asyncio.wait_for(delivered.acquire(), timeout=2.0)
     assert received_count == 3
 
+@pytest.mark.asyncio(loop_scope="module")
+async def test_batch_publish_delivers_in_order(recovery_system):
+    """
+    A pipelined batch should reach subscribers as individual messages, in order.
+    """
+    system = recovery_system
+    channel = "BATCH_TEST_CHANNEL"
+    received_seq = []
+    delivered = asyncio.Semaphore(0)
+    
+    def handler(data):
+        received_seq.append(data["message"]["data"]["seq"])
+        delivered.release()
+        
+    await subscribe_confirmed(system.message_bus, channel, handler)
+    
+    batch = [Event(event_type="TEST_BATCH", data={"seq": i}) for i in range(10)]
+    assert await system.message_bus.publish_batch(channel, batch)
+    
+    for _ in batch:
+        await asyncio.wait_for(delivered.acquire(), timeout=2.0)
+    assert received_seq == list(range(10))
+
 # --- System Resilience ---
 
-@pytest.mark.asyncio
-@pytest.mark.skip
+@pytest.mark.asyncio(loop_scope="module")
 async def test_invalid_json_handling(recovery_system):
     """
     System should not crash when receiving malformed JSON from Redis.
@@ -193,71 +226,223 @@ async def test_invalid_json_handling(recovery_system):
     
     # Bypass MessageBus.publish (which serializes) and write "garbage" directly to Redis
     redis_client = system.message_bus.redis_client
-    await redis_client.publish(channel, "this is not json { [ }")
-    
-    # Allow some time for processing
-    await asyncio.sleep(0.2)
+    await redis_client.publish(channel, b"this is not json { [ }")
     
     # System should still be running and able to process valid messages
     assert system.running
     
-    # Verify valid message still works
-    valid_received = False
+    # Verify valid message still works; it is delivered after the garbage,
+    # so receiving it proves the listener survived the malformed payload
+    valid_received = asyncio.Event()
     def valid_handler(data):
-        nonlocal valid_received
-        valid_received = True
+        valid_received.set()
         
-    system.message_bus.subscribe(channel, valid_handler)
-    await asyncio.sleep(0.5)
+    await subscribe_confirmed(system.message_bus, channel, valid_handler)
     valid_event = Event(event_type="TEST_VALID", data={"status": "ok"})
     await system.message_bus.publish_event(channel, valid_event)
     
-    for _ in range(10):
-        if valid_received:
-            break
-        await asyncio.sleep(0.1)
-        
-    assert valid_received, "System failed to process valid message after malformed input"
+    try:
+        await asyncio.wait_for(valid_received.wait(), timeout=2.0)
+    except TimeoutError:
+        pytest.fail("System failed to process valid message after malformed input")
 
-@pytest.mark.asyncio
-@pytest.mark.skip
+@pytest.mark.asyncio(loop_scope="module")
 async def test_rapid_connection_cycling(recovery_system):
     """
-    Verify system stability when connections are rapidly opened/closed?
-    Actually, mostly verify generic "Restart" capability of the system components.
+    Verify system stability when connections are rapidly opened/closed:
+    a reconnect must restore existing subscriptions without manual resubscribing.
     """
     system = recovery_system
     
-    # Simulate a "soft restart" of the message bus connection
-    # Note: access private method or just call connect again?
+    received = asyncio.Event()
+    def handler(data):
+        received.set()
+        
+    await subscribe_confirmed(system.message_bus, "RECONNECT_TEST", handler)
     
-    # Close existing
+    # Simulate a "soft restart" of the message bus connection
     if system.message_bus.redis_client:
         await system.message_bus.redis_client.close()
     
     # Wait a bit
     await asyncio.sleep(0.1)
     
-    # Reconnect
-    await system.message_bus.connect()
-    
+    # Reconnect; connect() replays the subscription onto the new pubsub
+    assert await system.message_bus.connect()
     assert await system.message_bus.redis_client.ping()
     
-    # Verify subscriptions are restored?
-    # The default MessageBus implementation generally needs to resubscribe logic
-    # Let's check if our implementation handles this or if we need to manually trigger it.
-    # Looking at Aexis MessageBus, it might not auto-resubscribe on manual close/open,
-    # but let's see if manual resubscription works.
-    
-    received = False
-    def handler(data):
-        nonlocal received
-        received = True
-        
-    system.message_bus.subscribe("RECONNECT_TEST", handler)
-    await asyncio.sleep(0.5)
     reconnect_event = Event(event_type="TEST_RECONNECT", data={"msg": "post-reconnect"})
     await system.message_bus.publish_event("RECONNECT_TEST", reconnect_event)
     
-    await asyncio.sleep(0.5)
-    assert received
+    await asyncio.wait_for(received.wait(), timeout=2.0)
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_repeated_connect_closes_previous_pubsub(redis_pool):
+    """
+    Calling connect() on a live bus must release the old pubsub connection
+    instead of leaking it behind the new one.
+    """
+    bus = MessageBus(redis_url=REDIS_URL, connection_pool=redis_pool)
+    assert await bus.connect()
+    await subscribe_confirmed(bus, "RECONNECT_TEST", lambda data: None)
+    stale = bus.pubsub
+    assert stale.connection is not None
+
+    assert await bus.connect()
+    assert bus.pubsub is not stale
+    assert stale.connection is None
+    await bus.disconnect()
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_reconnect_backoff_resets_after_success(monkeypatch):
+    """
+    Reconnect backoff doubles per failure, caps at RECONNECT_MAX_DELAY,
+    and starts over from RECONNECT_BASE_DELAY on the next outage.
+    """
+    bus = MessageBus(redis_url=REDIS_URL)
+    bus.running = True
+    outcomes = iter([False] * 8 + [True] + [False, True])
+    delays = []
+    
+    async def fake_connect():
+        return next(outcomes)
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(bus, "connect", fake_connect)
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    
+    assert await bus.reconnect()
+    assert delays == [1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 60.0, 60.0]
+    
+    delays.clear()
+    assert await bus.reconnect()
+    assert delays == [1.0]
+
+# --- Streams transport ---
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def stream_bus(redis_pool):
+    """StreamMessageBus on the shared pool, consuming in the background"""
+    bus = StreamMessageBus(redis_url=REDIS_URL, connection_pool=redis_pool)
+    assert await bus.connect()
+    await bus.redis_client.flushdb()
+    bus.running = True
+    listen_task = asyncio.create_task(bus.start_listening())
+    yield bus
+    await bus.stop_listening()
+    listen_task.cancel()
+    try:
+        await listen_task
+    except asyncio.CancelledError:
+        pass
+    await bus.disconnect()
+
+async def wait_until_acked(bus: StreamMessageBus, stream: str):
+    """Wait until the bus's consumer group has no pending entries on stream"""
+    while (await bus.redis_client.xpending(stream, bus.group))["pending"]:
+        await asyncio.sleep(0.01)
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_stream_delivery_is_acknowledged(stream_bus):
+    """
+    Events published over Streams are XADDed, delivered once and XACKed.
+    """
+    channel = MessageBus.CHANNELS["SYSTEM_EVENTS"]
+    received = asyncio.Event()
+    
+    def handler(data):
+        assert data["message"]["data"]["test_id"] == "stream_001"
+        received.set()
+    
+    stream_bus.subscribe(channel, handler)
+    await stream_bus._ensure_group(channel)
+    
+    event = Event(event_type="TEST_STREAM", data={"test_id": "stream_001"})
+    assert await stream_bus.publish_event(channel, event)
+    
+    await asyncio.wait_for(received.wait(), timeout=2.0)
+    await asyncio.wait_for(wait_until_acked(stream_bus, channel), timeout=2.0)
+    assert await stream_bus.redis_client.xlen(channel) == 1
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_stream_malformed_entry_is_dead_lettered(stream_bus):
+    """
+    A malformed entry is acknowledged and copied to the dead-letter stream
+    without blocking the valid entry behind it.
+    """
+    channel = "STREAM_ERROR_TEST"
+    received = asyncio.Event()
+    
+    stream_bus.subscribe(channel, lambda data: received.set())
+    await stream_bus._ensure_group(channel)
+    
+    await stream_bus.redis_client.xadd(channel, {"data": b"this is not json { [ }"})
+    await stream_bus.publish_event(channel, Event(event_type="TEST_VALID", data={}))
+    
+    await asyncio.wait_for(received.wait(), timeout=2.0)
+    await asyncio.wait_for(wait_until_acked(stream_bus, channel), timeout=2.0)
+    assert await stream_bus.redis_client.xlen(channel + StreamMessageBus.DEAD_LETTER_SUFFIX) == 1
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_stream_group_lifetime(redis_pool):
+    """
+    A named consumer group outlives its bus so a restart resumes from it;
+    an unnamed (ephemeral) group is destroyed on disconnect.
+    """
+    channel = MessageBus.CHANNELS["SYSTEM_EVENTS"]
+    
+    named = StreamMessageBus(redis_url=REDIS_URL, connection_pool=redis_pool, group="aexis-test")
+    ephemeral = StreamMessageBus(redis_url=REDIS_URL, connection_pool=redis_pool)
+    for bus in (named, ephemeral):
+        assert await bus.connect()
+        bus.subscribe(channel, lambda data: None)
+        await bus._ensure_group(channel)
+    
+    client = named.redis_client
+    await ephemeral.disconnect()
+    await named.disconnect()
+    
+    groups = {g["name"] for g in await client.xinfo_groups(channel)}
+    assert "aexis-test" in groups
+    assert ephemeral.group not in groups
+    await client.xgroup_destroy(channel, "aexis-test")
+
+def test_stream_maxlen_per_channel():
+    """
+    The state snapshot stream keeps a much shorter history than event streams.
+    """
+    bus = StreamMessageBus(redis_url=REDIS_URL, maxlen=5_000, channel_maxlen={"CUSTOM": 10})
+    assert bus._maxlen_for(MessageBus.CHANNELS["SYSTEM_EVENTS"]) == 5_000
+    assert bus._maxlen_for(MessageBus.CHANNELS["SYSTEM_STATE"]) == 100
+    assert bus._maxlen_for("CUSTOM") == 10
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_system_state_bypasses_stream_transport(recovery_system, redis_pool):
+    """
+    State snapshots reach pub/sub subscribers (the dashboard) even when the
+    bus runs on Streams, and are never appended to a stream.
+    """
+    channel = MessageBus.CHANNELS["SYSTEM_STATE"]
+    bus = StreamMessageBus(redis_url=REDIS_URL, connection_pool=redis_pool)
+    assert await bus.connect()
+    pubsub = bus.redis_client.pubsub()
+    await pubsub.subscribe(channel)
+    
+    original = recovery_system.message_bus
+    recovery_system.message_bus = bus
+    try:
+        await recovery_system._publish_system_state()
+    finally:
+        recovery_system.message_bus = original
+    
+    message = None
+    while message is None:
+        message = await asyncio.wait_for(
+            pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0), timeout=2.0
+        )
+    assert "timestamp" in orjson.loads(message["data"])
+    assert not await bus.redis_client.exists(channel)
+    await pubsub.aclose()
+    await bus.disconnect()
@@ -1,7 +1,6 @@
-import os
 import asyncio
+import logging
 import pytest
-import json
 from pathlib import Path
 from aexis.core.system import AexisSystem, SystemContext, AexisConfig
 from aexis.core.pod import PodStatus, PodType, LocationDescriptor
@@ -9,36 +8,37 @@ from aexis.core.network import NetworkContext
 from aexis.core.model import AssignRoute, PodArrival, Coordinate
 from aexis.core.message_bus import MessageBus
 
+logger = logging.getLogger(__name__)
+
 # --- Integration Test Configuration ---
-# Use a dedicated Redis DB for tests to ensure NO MOCKS while maintaining isolation
+# Redis-backed MessageBus; the fake_redis fixture serves this URL in-process
 TEST_REDIS_URL = "redis://localhost:6379/15" 
-TEST_NETWORK_JSON = "/home/godelhaze/dev/megalith/aexis/aexis/network.json"
-TEST_AEXIS_JSON = "/home/godelhaze/dev/megalith/aexis/aexis/aexis.json"
+TEST_NETWORK_JSON = str(Path(__file__).resolve().parent.parent / "network.json")
+TEST_AEXIS_CONFIG = {
+    "config": {
+        "debug": True,
+        "networkDataPath": TEST_NETWORK_JSON,
+        "pods": {"count": 5, "cargoPercentage": 50},
+        "stations": {"count": 21},
+        "ai": {"provider": "none"},
+        # Override Redis URL for test isolation (Real Redis, just different DB)
+        "redis": {"url": TEST_REDIS_URL},
+    }
+}
 
 import pytest_asyncio
 
-@pytest_asyncio.fixture(scope="function")
-async def system_instance():
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def system_instance(redis_pool):
     """Initialize full Aexis system with real config and no mocks."""
     # Reset Singletons
     SystemContext._instance = None
     NetworkContext._instance = None
     
-    # Load real production config and override Redis for test isolation
-    with open(TEST_AEXIS_JSON, 'r') as f:
-        config_data = json.load(f)
-    
-    # Override Redis URL for test isolation (Real Redis, just different DB)
-    config_data['config']['redis']['url'] = TEST_REDIS_URL
-    config_data['config']['networkDataPath'] = TEST_NETWORK_JSON
-    
-    # Write temp config for SystemContext to load
-    temp_config_path = "/tmp/aexis_test_config.json"
-    with open(temp_config_path, 'w') as f:
-        json.dump(config_data, f)
-    
-    ctx = SystemContext.initialize_sync(temp_config_path)
-    aexis_system = AexisSystem(system_context=ctx)
+    # Inject the config in memory; no temp file round-trip
+    ctx = SystemContext.initialize_from_dict(TEST_AEXIS_CONFIG)
+    bus = MessageBus(redis_url=TEST_REDIS_URL, connection_pool=redis_pool)
+    aexis_system = AexisSystem(system_context=ctx, message_bus=bus)
     
     # Ensure message bus is connected
     await aexis_system.message_bus.connect()
@@ -48,7 +48,7 @@ async def system_instance():
     
     # Start message bus listening in background
     aexis_system.running = True
-    asyncio.create_task(aexis_system.message_bus.start_listening())
+    listen_task = asyncio.create_task(aexis_system.message_bus.start_listening())
     
     # Start all pods so they subscribe to commands
     for pod in aexis_system.pods.values():
@@ -58,8 +58,37 @@ async def system_instance():
     
     # Cleanup
     await aexis_system.shutdown()
-    if os.path.exists(temp_config_path):
-        os.remove(temp_config_path)
+    listen_task.cancel()
+    try:
+        await listen_task
+    except asyncio.CancelledError:
+        pass
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="module")
+async def reset_pods(system_instance):
+    """Return every pod to a clean idle state between tests sharing the system"""
+    for pod in system_instance.pods.values():
+        pod.status = PodStatus.IDLE
+        pod.route_queue.clear()
+        pod.current_segment = None
+        pod.segment_progress = 0.0
+    await system_instance.message_bus.redis_client.flushdb()
+    yield
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def command_delivered(system_instance):
+    """Semaphore released once per pod command, after the pods have handled it"""
+    bus = system_instance.message_bus
+    channel = MessageBus.CHANNELS["POD_COMMANDS"]
+    delivered = asyncio.Semaphore(0)
+
+    def on_command(data):
+        delivered.release()
+
+    # Subscribed after the pods, so it runs once their handlers have returned
+    bus.subscribe(channel, on_command)
+    yield delivered
+    bus.unsubscribe(channel, on_command)
 
 # --- Routing Vector Scenarios ---
 
@@ -87,71 +116,74 @@ ROUTING_SCENARIOS = [
     ("nadir", ["station_021", "station_004"], "station_004"),
 ]
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("name, route, expected", ROUTING_SCENARIOS)
-async def test_no_mock_routing_navigation(system_instance, name, route, expected):
+@pytest.mark.profile
+@pytest.mark.asyncio(loop_scope="module")
+async def test_all_routes(system_instance, command_delivered):
     """
     NO-MOCK INTEGRATION TEST:
-    Verify that a pod correctly navigates a complex route across the real network topology.
+    Verify that a pod correctly navigates complex routes across the real network topology.
+    Scenarios run serially on one pod so commands and arrival events never interleave.
     Falsifies: Pathfinding correctness, segment transition state machine.
     """
-    # Pick an idle pod
-    pod = next(iter(system_instance.pods.values()))
-    
-    # Ensure pod is at the start station for clean test
-    start_station = route[0]
-    station_obj = system_instance.stations.get(start_station)
-    assert station_obj, f"Start station {start_station} not found in system"
-    
-    pod.location_descriptor.node_id = start_station
-    pod.location_descriptor.location_type = "station"
-    pod.location_descriptor.coordinate = Coordinate(
-        station_obj.coordinate.get("x", 0),
-        station_obj.coordinate.get("y", 0)
-    )
-    pod.status = PodStatus.IDLE
-    pod.current_segment = None
-    pod.route_queue.clear()
-    
-    # Assign route via AssignRoute command (simulating external API/System command)
-    command = AssignRoute(
-        target=pod.pod_id,
-        route=route
-    )
-    
-    # Inject directly via message bus to test the full loop
-    success = await system_instance.message_bus.publish_command(
-        MessageBus.CHANNELS["POD_COMMANDS"], 
-        command
+    bus = system_instance.message_bus
+    channel = MessageBus.CHANNELS["POD_COMMANDS"]
+    # Passenger pods settle on arrival at once; cargo pods hold the dock for 2s of wall time
+    pod = next(p for p in system_instance.pods.values() if p.pod_type == PodType.PASSENGER)
+    failures = []
+
+    async def wait_for_arrival(expected, max_ticks=500):
+        # Increased tick budget for long-range routes
+        for _ in range(max_ticks):
+            await system_instance._simulate_pods_bulk(dt=0.5)
+            # Let arrival handlers spawned by the tick run before checking
+            await asyncio.sleep(0)
+            if pod.location_descriptor.node_id == expected and pod.status == PodStatus.IDLE:
+                return True
+        return False
+
+    for name, route, expected in ROUTING_SCENARIOS:
+        # Ensure pod is at the start station for clean test
+        start_station = route[0]
+        station_obj = system_instance.stations.get(start_station)
+        if not station_obj:
+            failures.append(f"{name}: start station {start_station} not found in system")
+            continue
+
+        pod.location_descriptor.node_id = start_station
+        pod.location_descriptor.location_type = "station"
+        pod.location_descriptor.coordinate = Coordinate(
+            station_obj.coordinate.get("x", 0),
+            station_obj.coordinate.get("y", 0)
+        )
+        pod.status = PodStatus.IDLE
+        pod.current_segment = None
+        pod.route_queue.clear()
+
+        # Inject directly via message bus to test the full loop
+        command = AssignRoute(target=pod.pod_id, route=route)
+        if not await bus.publish_command(channel, command):
+            failures.append(f"{name}: failed to publish AssignRoute command")
+            continue
+        await asyncio.wait_for(command_delivered.acquire(), timeout=2.0)
+        logger.debug(
+            "[%s] %s status after command: %s, Queue length: %d",
+            pod.pod_id, name, pod.status, len(pod.route_queue)
+        )
+
+        if not await wait_for_arrival(expected):
+            failures.append(
+                f"{name}: pod {pod.pod_id} failed to reach {expected}. "
+                f"Current: {pod.location_descriptor.node_id}, Status: {pod.status}"
+            )
+
+    logger.info(
+        "Routing scenarios: %d/%d arrived",
+        len(ROUTING_SCENARIOS) - len(failures), len(ROUTING_SCENARIOS)
     )
-    assert success, "Failed to publish AssignRoute command"
-    
-    # Wait for the background listener to pick up and process the command
-    await asyncio.sleep(0.2)
-    print(f"[{pod.pod_id}]: Status after command delay: {pod.status}, Queue length: {len(pod.route_queue)}")
-    
-    # Wait for the system to process the command and the pod to move
-    # We poll the pod status and location
-    max_retries = 500 # Increased for long-range routes
-    arrived = False
-    
-    for i in range(max_retries):
-        # Allow system to process physics and events
-        await system_instance._simulate_pod_movement_once(0.5) # Force tick
-        
-        if pod.location_descriptor.node_id == expected and pod.status == PodStatus.IDLE:
-            arrived = True
-            break
-        
-        if i % 50 == 0:
-             print(f"[{pod.pod_id}]: Step {i}, Loc: {pod.location_descriptor.node_id}, Status: {pod.status}")
-             
-        await asyncio.sleep(0.01)
-        
-    assert arrived, f"Pod {pod.pod_id} failed to reach {expected} in {name}. Current: {pod.location_descriptor.node_id}, Status: {pod.status}"
+    assert not failures, "Routing scenarios failed:\n" + "\n".join(failures)
 
-@pytest.mark.asyncio
-async def test_adversarial_malicious_node_routing(system_instance):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_adversarial_malicious_node_routing(system_instance, command_delivered):
     """
     ADVERSARIAL: Attempt to route to a non-existent station ID.
     Verify: System does not crash and pod remains IDLE or rejects.
@@ -171,16 +203,15 @@ async def test_adversarial_malicious_node_routing(system_instance):
         command
     )
     
-    # Wait a bit
-    await asyncio.sleep(0.5)
-    await system_instance._simulate_pod_movement_once(1.0)
+    await asyncio.wait_for(command_delivered.acquire(), timeout=2.0)
+    await system_instance._simulate_pods_bulk(dt=1.0)
     
     # Should still be IDLE at start or current location
     assert pod.status == PodStatus.IDLE
     assert pod.location_descriptor.node_id == start_station
 
-@pytest.mark.asyncio
-async def test_adversarial_disconnected_routing(system_instance):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_adversarial_disconnected_routing(system_instance, command_delivered):
     """
     ADVERSARIAL: Attempt to route between stations with no physical path.
     Verify: System handles pathfinding failure gracefully.
@@ -194,15 +225,16 @@ async def test_adversarial_disconnected_routing(system_instance):
         command
     )
     
-    await asyncio.sleep(0.1)
-    await system_instance._simulate_pod_movement_once(1.0)
+    await asyncio.wait_for(command_delivered.acquire(), timeout=2.0)
+    await system_instance._simulate_pods_bulk(dt=1.0)
     
     assert pod.status == PodStatus.IDLE
 
-@pytest.mark.asyncio
-async def test_thundering_herd_routing_hammering(system_instance):
+@pytest.mark.profile
+@pytest.mark.asyncio(loop_scope="module")
+async def test_thundering_herd_routing_hammering(system_instance, command_delivered):
     """
-    STRESS: Hammer a single pod with 20 rapid route assignments.
+    STRESS: Hammer a single pod with 20 rapid route assignments, sent as one pipelined batch.
     Verify: State consistency and that the LATEST command eventually wins or is queued.
     """
     pod = next(iter(system_instance.pods.values()))
@@ -210,18 +242,21 @@ async def test_thundering_herd_routing_hammering(system_instance):
     
     stations = ["station_002", "station_003", "station_004", "station_005"]
     
-    # Parallel bombardment
-    tasks = [
-        system_instance.message_bus.publish_command(
-            MessageBus.CHANNELS["POD_COMMANDS"], 
-            AssignRoute(target=pod.pod_id, route=["station_001", s])
+    channel = MessageBus.CHANNELS["POD_COMMANDS"]
+    # Serialize each distinct command once and reuse the bytes across the batch
+    payloads = [
+        system_instance.message_bus.serialize_command(
+            channel, AssignRoute(target=pod.pod_id, route=["station_001", s])
         )
         for s in stations
     ]
-    await asyncio.gather(*tasks)
+    commands = [payloads[i % len(payloads)] for i in range(20)]
+    success = await system_instance.message_bus.publish_batch(channel, commands)
+    assert success, "Failed to publish AssignRoute batch"
     
-    # Wait for processing
-    await asyncio.sleep(0.5)
+    # Wait for every command to be processed
+    for _ in commands:
+        await asyncio.wait_for(command_delivered.acquire(), timeout=2.0)
     
     # Pod should be targeting ONE of these, not in a corrupted state
     assert pod.status in [PodStatus.EN_ROUTE, PodStatus.IDLE]
@@ -1,21 +1,18 @@
-import sys
+import logging
 import os
 from pathlib import Path
-from unittest.mock import MagicMock
-
-# Mock redis before imports
-sys.modules['redis'] = MagicMock()
-sys.modules['redis.asyncio'] = MagicMock()
 
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from aexis.core.system import AexisSystem, SystemContext, AexisConfig
 from aexis.core.pod import Pod, PodStatus
 from aexis.core.model import PodPositionUpdate
 from aexis.core.network import NetworkContext
 
+logger = logging.getLogger(__name__)
+
 # --- Fixtures ---
 
 @pytest.fixture
@@ -57,7 +54,7 @@ def mock_system_context(mocker):
     base_dir = Path(__file__).resolve().parent
     network_path = base_dir / "test_network.json"
     
-    print(f"\nDEBUG: Loading test network from {network_path}")
+    logger.debug("Loading test network from %s", network_path)
 
     # Reset singleton
     NetworkContext._instance = None
@@ -113,7 +110,7 @@ async def test_system_initialization_and_movement(aexis_system, mocker):
     pod_id = list(aexis_system.pods.keys())[0]
     pod = aexis_system.pods[pod_id]
     
-    print(f"\nInitialized Pod {pod_id} at {pod.location_descriptor}")
+    logger.debug("Initialized Pod %s at %s", pod_id, pod.location_descriptor)
     
     # Ensure it spawned on an edge (most likely, though small chance of station fallback)
     # The test network has 2 edges (A<->B, B<->C) and 3 stations.
@@ -154,7 +151,7 @@ async def test_system_initialization_and_movement(aexis_system, mocker):
             
     assert len(events) >= 3, f"Expected continuous updates, got {len(events)}"
     
-    print(f"\nCaptured {len(events)} position events for {pod_id}.")
+    logger.debug("Captured %d position events for %s", len(events), pod_id)
     
     # 4. Verify Monotonic Movement
     # The pod moves along a specific edge. X (or Y) should change monotonically.
@@ -163,11 +160,11 @@ async def test_system_initialization_and_movement(aexis_system, mocker):
     last_x = events[-1].location.coordinate.x
     
     diff = last_x - first_x
-    print(f"Movement: Start X={first_x}, End X={last_x}, Diff={diff}")
+    logger.debug("Movement: Start X=%s, End X=%s, Diff=%s", first_x, last_x, diff)
     
     assert abs(diff) > 0.0001, "Pod did not move significantly"
     
     # Verify interval consistency roughly
     # (Just ensuring we didn't get all events in one burst)
     
-    print("\n✅ End-to-End verification successful: System initialized real pod and drove it.")
+    logger.info("End-to-End verification successful: %s moved %.2f along X", pod_id, diff)
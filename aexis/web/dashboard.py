@@ -1,39 +1,189 @@
 import asyncio
-import json
 import logging
+import mimetypes
 import os
+import stat
+import time
+from contextlib import asynccontextmanager, suppress
+from collections import OrderedDict
 
+import anyio
 import httpx
+import orjson
 import redis.asyncio as redis
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
 
 logger = logging.getLogger(__name__)
 
 
+# Asset bytes keyed on (path, mtime_ns) so edits invalidate the entry; LRU order
+_ASSET_CACHE: OrderedDict[tuple[str, int], bytes] = OrderedDict()
+_ASSET_CACHE_SIZE = 64
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+async def _read_asset(path: str, mtime_ns: int) -> bytes:
+    """Asset bytes from memory; a cold read runs in a worker thread"""
+    key = (path, mtime_ns)
+    body = _ASSET_CACHE.get(key)
+    if body is not None:
+        _ASSET_CACHE.move_to_end(key)
+        return body
+
+    body = await anyio.to_thread.run_sync(_read_file, path)
+    _ASSET_CACHE[key] = body
+    if len(_ASSET_CACHE) > _ASSET_CACHE_SIZE:
+        _ASSET_CACHE.popitem(last=False)
+    return body
+
+
+# get_system_state() fields that change every tick without carrying news
+VOLATILE_STATE_KEYS = ("timestamp", "uptime_seconds")
+# Distinguishes an absent entry from one whose value is None
+_MISSING = object()
+
+
+def _state_delta(previous: dict, current: dict) -> tuple[dict, list[list[str]]]:
+    """What changed from previous to current, as (changed, removed)
+
+    changed holds top-level keys of current that differ; dict values keep only
+    their changed entries. removed lists key paths that are gone: [key] for a
+    top-level key, [key, entry] for an entry of a dict value. Both are empty
+    when nothing but VOLATILE_STATE_KEYS differs.
+    """
+    changed = {}
+    removed = []
+    for key, value in current.items():
+        if key in VOLATILE_STATE_KEYS:
+            continue
+        old = previous.get(key, _MISSING)
+        if value == old:
+            continue
+        if isinstance(value, dict) and isinstance(old, dict):
+            entries = {k: v for k, v in value.items() if old.get(k, _MISSING) != v}
+            if entries:
+                changed[key] = entries
+            removed.extend([key, k] for k in old if k not in value)
+        else:
+            changed[key] = value
+
+    removed.extend(
+        [key] for key in previous if key not in current and key not in VOLATILE_STATE_KEYS
+    )
+
+    if changed or removed:
+        changed.update({k: current[k] for k in VOLATILE_STATE_KEYS if k in current})
+    return changed, removed
+
+
 class NoCacheStaticFiles(StaticFiles):
+    # Force no caching for all static files (especially JS/CSS)
+    NO_CACHE_HEADERS = {
+        "Cache-Control": "no-cache, no-store, must-revalidate",
+        "Pragma": "no-cache",
+        "Expires": "0",
+    }
+    # Files up to this size are served from memory instead of disk
+    MAX_CACHED_SIZE = 256 * 1024
+    # How long a cached stat result is trusted before checking the file again
+    STAT_TTL = 2.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats: dict[str, tuple[float, str, os.stat_result]] = {}
+
+    async def _cached_lookup(self, path: str) -> tuple[str, os.stat_result | None]:
+        """lookup_path with the stat result reused for STAT_TTL seconds"""
+        now = time.monotonic()
+        cached = self._stats.get(path)
+        if cached and cached[0] > now:
+            return cached[1], cached[2]
+
+        # stat() blocks; run it off the event loop as StaticFiles does
+        full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
+        if stat_result is not None:
+            self._stats[path] = (now + self.STAT_TTL, full_path, stat_result)
+        return full_path, stat_result
+
+    async def get_response(self, path: str, scope) -> Response:
+        # Range requests need StaticFiles' partial-content handling
+        if scope["method"] == "GET" and "range" not in Headers(scope=scope):
+            try:
+                full_path, stat_result = await self._cached_lookup(path)
+            except (OSError, ValueError):
+                stat_result = None  # let StaticFiles map the error
+
+            if (
+                stat_result is not None
+                and stat.S_ISREG(stat_result.st_mode)
+                and stat_result.st_size <= self.MAX_CACHED_SIZE
+            ):
+                try:
+                    body = await _read_asset(full_path, stat_result.st_mtime_ns)
+                except OSError:
+                    # Stale stat for a file removed since; StaticFiles answers 404
+                    self._stats.pop(path, None)
+                else:
+                    return Response(
+                        body,
+                        media_type=mimetypes.guess_type(full_path)[0] or "text/plain",
+                        headers=self.NO_CACHE_HEADERS,
+                    )
+
+        return await super().get_response(path, scope)
+
     def file_response(self, *args, **kwargs) -> FileResponse:
         response = super().file_response(*args, **kwargs)
-        # Force no caching for all static files (especially JS/CSS)
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
+        response.headers.update(self.NO_CACHE_HEADERS)
         return response
 
 
 class WebDashboard:
     """FastAPI web dashboard - serves SPA and proxies API requests"""
 
+    # Upper bound on a single client send so a stalled socket cannot hold up a tick
+    SEND_TIMEOUT = 1.0
+    # Core pushes get_system_state() here (MessageBus.CHANNELS["SYSTEM_STATE"])
+    SYSTEM_STATE_CHANNEL = "aexis:system_state"
+    # HTTP polling interval used only while Redis push is unavailable
+    POLL_INTERVAL = 2.0
+    # Full state is resent at least this often so clients resync after deltas
+    FULL_STATE_INTERVAL = 30.0
+    # Redis listener reconnect backoff, as in MessageBus.reconnect
+    RECONNECT_BASE_DELAY = 1.0
+    RECONNECT_MAX_DELAY = 60.0
+
     def __init__(self, api_base_url: str = "http://localhost:8001"):
         self.api_base_url = api_base_url
+        self._static_dir = os.path.join(os.path.dirname(__file__), "static")
+        self._index_path = os.path.join(self._static_dir, "index.html")
         self.app = FastAPI(
             title="AEXIS Dashboard",
             description="Autonomous Event-Driven Transportation Intelligence System",
             version="1.0.0",
+            lifespan=self._lifespan,
         )
-        self.websocket_connections: list[WebSocket] = []
+        self.websocket_connections: set[WebSocket] = set()
+        # Shared upstream client, opened and closed by the app lifespan
+        self.client: httpx.AsyncClient | None = None
+        self._redis_running = False
+        self._redis_connected = False
+        # Successful Redis connections so far; resets the listener backoff
+        self._redis_connects = 0
+        # Last system state broadcast, for delta computation
+        self._last_state: dict | None = None
+        self._last_full_state_at = 0.0
+        self._poller_task: asyncio.Task | None = None
+        self._redis_task: asyncio.Task | None = None
 
         # Setup CORS and middleware
         self._setup_middleware()
@@ -44,6 +194,30 @@ class WebDashboard:
         # Setup static files
         self._setup_static_files()
 
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """Own the upstream HTTP client and background tasks for the app lifetime"""
+        self.client = httpx.AsyncClient(
+            base_url=self.api_base_url,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            timeout=5.0,
+        )
+        try:
+            # The TaskGroup owns the background tasks: they are cancelled and
+            # awaited before the client closes, so nothing outlives a reload
+            async with asyncio.TaskGroup() as tg:
+                self._poller_task = tg.create_task(self.start_background_poller())
+                self._redis_task = tg.create_task(self.start_redis_listener())
+                try:
+                    yield
+                finally:
+                    self._redis_running = False
+                    self._poller_task.cancel()
+                    self._redis_task.cancel()
+        finally:
+            await self.client.aclose()
+            self.client = None
+
     def _setup_middleware(self):
         """Setup CORS and other middleware"""
         self.app.add_middleware(
@@ -53,6 +227,9 @@ class WebDashboard:
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        # Pod/station payloads are large, repetitive JSON; level 1 gets most of
+        # the size win for little CPU
+        self.app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
 
     def _setup_routes(self):
         """Setup API routes"""
@@ -60,43 +237,43 @@ class WebDashboard:
         @self.app.get("/")
         async def index():
             """Serve main dashboard SPA"""
-            # Serve the index.html file
-            return FileResponse(
-                os.path.join(os.path.dirname(__file__), "static", "index.html")
-            )
+            # One stat per page load; the bytes are re-read only when the file changes
+            stat_result = await anyio.to_thread.run_sync(os.stat, self._index_path)
+            body = await _read_asset(self._index_path, stat_result.st_mtime_ns)
+            return Response(body, media_type="text/html")
 
         @self.app.get("/api/system/status")
-        async def get_system_status():
+        async def get_system_status() -> Response:
             """Proxy system status from API"""
             return await self._proxy_request("GET", "/api/system/status")
 
         @self.app.get("/api/system/metrics")
-        async def get_system_metrics():
+        async def get_system_metrics() -> Response:
             """Proxy system metrics from API"""
             return await self._proxy_request("GET", "/api/system/metrics")
 
         @self.app.get("/api/network")
-        async def get_network():
+        async def get_network() -> Response:
             """Proxy network topology from API"""
             return await self._proxy_request("GET", "/api/network")
 
         @self.app.get("/api/pods")
-        async def get_all_pods():
+        async def get_all_pods() -> Response:
             """Proxy all pod states from API"""
             return await self._proxy_request("GET", "/api/pods")
 
         @self.app.get("/api/pods/{pod_id}")
-        async def get_pod(pod_id: str):
+        async def get_pod(pod_id: str) -> Response:
             """Proxy specific pod state from API"""
             return await self._proxy_request("GET", f"/api/pods/{pod_id}")
 
         @self.app.get("/api/stations")
-        async def get_all_stations():
+        async def get_all_stations() -> Response:
             """Proxy all station states from API"""
             return await self._proxy_request("GET", "/api/stations")
 
         @self.app.get("/api/stations/{station_id}")
-        async def get_station(station_id: str):
+        async def get_station(station_id: str) -> Response:
             """Proxy specific station state from API"""
             return await self._proxy_request("GET", f"/api/stations/{station_id}")
 
@@ -112,29 +289,31 @@ class WebDashboard:
 
         # Generic Proxy for Manual Injection
         @self.app.post("/api/manual/{path:path}")
-        async def proxy_post(path: str, request: dict):
+        async def proxy_post(path: str, request: Request) -> Response:
+            # Forward the body untouched; the Core API validates it
             return await self._proxy_request(
-                "POST", f"/api/manual/{path}", json_data=request
+                "POST",
+                f"/api/manual/{path}",
+                content=await request.body(),
+                headers={
+                    "content-type": request.headers.get(
+                        "content-type", "application/json"
+                    )
+                },
             )
 
-    async def _proxy_request(
-        self, method: str, path: str, json_data: dict | None = None
-    ):
-        """Generic proxy handler with resilience"""
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Issue an upstream request with resilience"""
         try:
-            async with httpx.AsyncClient() as client:
-                if json_data:
-                    response = await client.request(
-                        method, f"{self.api_base_url}{path}", json=json_data
-                    )
-                else:
-                    response = await client.request(
-                        method, f"{self.api_base_url}{path}"
-                    )
-                if response.status_code == 404:
-                    raise HTTPException(
-                        status_code=404, detail="Resource not found")
-                return response.json()
+            response = await self.client.request(
+                method, path, content=content, headers=headers
+            )
         except httpx.ConnectError:
             # Resilience: Return offline status or empty data instead of crashing
             logger.warning(f"Backend API offline: {path}")
@@ -143,43 +322,65 @@ class WebDashboard:
             logger.error(f"Proxy error {path}: {e}")
             raise HTTPException(status_code=500, detail="Proxy Error")
 
+        if response.status_code == 404:
+            raise HTTPException(status_code=404, detail="Resource not found")
+        return response
+
+    async def _proxy_request(
+        self,
+        method: str,
+        path: str,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        """Generic proxy handler; relays the upstream body without re-encoding"""
+        response = await self._fetch(method, path, content, headers)
+        return Response(
+            content=response.content,
+            status_code=response.status_code,
+            media_type=response.headers.get("content-type", "application/json"),
+        )
+
+    async def _proxy_request_json(self, method: str, path: str):
+        """Proxy handler for callers that need the decoded payload"""
+        response = await self._fetch(method, path)
+        return orjson.loads(response.content)
+
     def _setup_static_files(self):
         """Setup static file serving"""
-        static_dir = os.path.join(os.path.dirname(__file__), "static")
-        if not os.path.exists(static_dir):
-            os.makedirs(static_dir)
+        if not os.path.exists(self._static_dir):
+            os.makedirs(self._static_dir)
         self.app.mount(
-            "/static", NoCacheStaticFiles(directory=static_dir), name="static"
+            "/static", NoCacheStaticFiles(directory=self._static_dir), name="static"
         )
 
     async def _handle_websocket(self, websocket: WebSocket):
         """Handle WebSocket connections for real-time updates"""
         await websocket.accept()
-        self.websocket_connections.append(websocket)
+        self.websocket_connections.add(websocket)
+        # Send a full state next so the new client has a base for deltas
+        self._last_state = None
         try:
             # Poll for initial state
             try:
-                state = await self._proxy_request("GET", "/api/system/status")
+                state = await self._proxy_request_json("GET", "/api/system/status")
                 await websocket.send_text(
-                    json.dumps({"type": "system_state", "data": state})
+                    orjson.dumps({"type": "system_state", "data": state}).decode()
                 )
             except:
                 pass  # Ignore initial fetch failure
 
+            # Client messages are not used; park on raw receive() until the
+            # disconnect frame. Dead peers are reaped by uvicorn's ping/pong.
             while True:
-                try:
-                    # Keep alive / read messages
-                    message = await websocket.receive_text()
-                    print(f"Got status message {message}")
-                    # We could handle client messages here
-                except WebSocketDisconnect:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
                     break
 
         except Exception as e:
             logger.debug(f"WebSocket connection error: {e}", exc_info=True)
         finally:
-            if websocket in self.websocket_connections:
-                self.websocket_connections.remove(websocket)
+            self.websocket_connections.discard(websocket)
 
     async def _handle_positions_websocket(self, websocket: WebSocket):
         """Handle WebSocket connections for real-time pod position updates
@@ -235,39 +436,101 @@ class WebDashboard:
             except:
                 pass
 
-    # Note: In a real production split, we'd need a way to receive events
-    # from the Core System (e.g. via Redis PubSub) to broadcast to WebSockets.
-    # For now, the client polls via the 'get_state' or we can implement a
-    # background task here to poll the API and broadcast.
-    # For this refactor, I will add a background poller to simulate push.
-
     async def start_background_poller(self):
-        """Poll API and broadcast updates"""
+        """Fallback: poll the API for state while Redis push is unavailable"""
         while True:
             try:
-                if self.websocket_connections:
-                    state = await self._proxy_request("GET", "/api/system/status")
-                    await self.broadcast({"type": "system_state", "data": state})
-            except:
+                if self.websocket_connections and not self._redis_connected:
+                    state = await self._proxy_request_json("GET", "/api/system/status")
+                    await self.broadcast_state(state)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
                 pass  # meaningful logging is handled in proxy_request
 
-            await asyncio.sleep(2)  # 2s polling interval
+            await asyncio.sleep(self.POLL_INTERVAL)
 
     async def broadcast(self, message: dict):
-        """Broadcast message to all clients"""
-        serialized = json.dumps(message)
-        for ws in self.websocket_connections:
-            try:
-                await ws.send_text(serialized)
-            except:
-                pass
+        """Broadcast message to all clients concurrently, dropping dead sockets"""
+        if not self.websocket_connections:
+            return
+
+        # Serialize once for every client; the SPA expects text frames
+        serialized = orjson.dumps(message).decode()
+        clients = list(self.websocket_connections)
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(ws.send_text(serialized), timeout=self.SEND_TIMEOUT)
+                for ws in clients
+            ),
+            return_exceptions=True,
+        )
+        dead = {
+            ws for ws, result in zip(clients, results) if isinstance(result, Exception)
+        }
+        if dead:
+            logger.debug(f"Dropping {len(dead)} unresponsive WebSocket clients")
+            self.websocket_connections -= dead
+            # A slow client may still be connected; closing lets the SPA reconnect
+            await asyncio.gather(*(self._close_quietly(ws) for ws in dead))
+
+    async def _close_quietly(self, ws: WebSocket):
+        """Best-effort close of a dropped client socket"""
+        with suppress(Exception):
+            await asyncio.wait_for(ws.close(code=1011), timeout=self.SEND_TIMEOUT)
+
+    async def broadcast_state(self, state: dict):
+        """Broadcast system state, sending only what changed since the last one"""
+        if not self.websocket_connections:
+            # Nobody to keep in sync; the next client gets a full state first
+            self._last_state = None
+            return
+
+        previous = self._last_state
+        self._last_state = state
+        now = time.monotonic()
+
+        resync_due = now - self._last_full_state_at >= self.FULL_STATE_INTERVAL
+        if previous is None or resync_due:
+            self._last_full_state_at = now
+            await self.broadcast({"type": "system_state", "data": state})
+            return
+
+        changed, removed = _state_delta(previous, state)
+        if changed or removed:
+            await self.broadcast(
+                {"type": "system_state_delta", "data": changed, "removed": removed}
+            )
 
     async def start_redis_listener(self):
-        """Subscribe to Redis channels and forward events to WebSocket clients"""
+        """Forward Redis events to WebSocket clients, reconnecting with backoff
+
+        Mirrors MessageBus.reconnect: the delay doubles per failed attempt up to
+        RECONNECT_MAX_DELAY and starts over once a connection has been made.
+        """
+        self._redis_running = True
+        delay = self.RECONNECT_BASE_DELAY
+        while self._redis_running:
+            connects = self._redis_connects
+            try:
+                await self._forward_redis_events()
+                if not self._redis_running:
+                    break
+                logger.warning("Redis listener stream ended, reconnecting")
+            except Exception as e:
+                logger.warning(f"Redis listener error: {e}")
+            if self._redis_connects != connects:
+                # This attempt got through, so the outage starts a fresh backoff
+                delay = self.RECONNECT_BASE_DELAY
+            logger.info(f"Reconnecting dashboard to Redis in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+
+    async def _forward_redis_events(self):
+        """One Redis connection: subscribe and forward until it drops"""
         redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
         redis_password = os.getenv("REDIS_PASSWORD")
 
-        self._redis_running = True
         redis_client = None
         pubsub = None
 
@@ -280,68 +543,56 @@ class WebDashboard:
 
             pubsub = redis_client.pubsub()
 
-            # Subscribe to event channels
+            # Subscribe to event channels and the pushed system state
             channels = [
                 "aexis:events:passenger",
                 "aexis:events:cargo",
                 "aexis:events:pods",
                 "aexis:events:system",
+                self.SYSTEM_STATE_CHANNEL,
             ]
 
-            for channel in channels:
-                await pubsub.subscribe(channel)
-                logger.info(f"Dashboard subscribed to {channel}")
+            await pubsub.subscribe(*channels)
+            logger.info(f"Dashboard subscribed to {channels}")
+            self._redis_connected = True
+            self._redis_connects += 1
 
             # Listen and forward
-            while self._redis_running:
+            async for message in pubsub.listen():
+                if not self._redis_running:
+                    break
+                if message["type"] != "message":
+                    continue
                 try:
-                    message = await asyncio.wait_for(
-                        pubsub.get_message(
-                            ignore_subscribe_messages=True, timeout=1.0),
-                        timeout=2.0,
-                    )
-                    if message and message["type"] == "message":
-                        try:
-                            data = json.loads(message["data"])
-                            await self.broadcast(
-                                {
-                                    "type": "event",
-                                    "channel": message["channel"],
-                                    "data": data.get("message", data),
-                                }
-                            )
-                        except json.JSONDecodeError:
-                            pass
-                except TimeoutError:
+                    data = orjson.loads(message["data"])
+                except orjson.JSONDecodeError:
                     continue
 
-        except Exception as e:
-            logger.error(f"Redis listener error: {e}")
+                if message["channel"] == self.SYSTEM_STATE_CHANNEL:
+                    await self.broadcast_state(data)
+                else:
+                    await self.broadcast(
+                        {
+                            "type": "event",
+                            "channel": message["channel"],
+                            "data": data.get("message", data),
+                        }
+                    )
         finally:
             # Cleanup
+            self._redis_connected = False
             if pubsub:
                 try:
                     await pubsub.unsubscribe()
                     await pubsub.aclose()
-                except:
+                except Exception:
                     pass
             if redis_client:
                 try:
                     await redis_client.aclose()
-                except:
+                except Exception:
                     pass
 
     def get_app(self) -> FastAPI:
         """Get FastAPI application instance"""
-
-        # Start background tasks on startup
-        @self.app.on_event("startup")
-        async def startup_event():
-            asyncio.create_task(self.start_background_poller())
-            asyncio.create_task(self.start_redis_listener())
-
-        @self.app.on_event("shutdown")
-        async def shutdown_event():
-            self._redis_running = False
-
         return self.app
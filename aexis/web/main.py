@@ -5,6 +5,11 @@ import sys
 
 import uvicorn
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from aexis.web.dashboard import WebDashboard
 
 # Configure logging
@@ -29,7 +34,21 @@ async def main():
         dashboard = WebDashboard(api_base_url=api_url)
         app = dashboard.get_app()
 
-        config = uvicorn.Config(app=app, host=host, port=port, log_level="warning")
+        config = uvicorn.Config(
+            app=app,
+            host=host,
+            port=port,
+            log_level="warning",
+            loop="uvloop" if uvloop else "asyncio",
+            http="httptools",
+            # permessage-deflate for the broadcast sockets
+            ws="websockets",
+            ws_per_message_deflate=True,
+            interface="asgi3",
+            # Protocol-level keep-alive so half-open dashboard sockets close quickly
+            ws_ping_interval=10.0,
+            ws_ping_timeout=5.0,
+        )
         server = uvicorn.Server(config)
         await server.serve()
 
@@ -39,4 +58,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # server.serve() runs on the caller's loop, so uvloop has to be chosen here
+    asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
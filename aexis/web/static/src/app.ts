@@ -30,6 +30,8 @@ interface UpdateMetricsPayload {
 interface WebSocketMessage {
   type: string;
   data?: Record<string, unknown>;
+  // system_state_delta only: key paths ([key] or [key, entry]) to delete
+  removed?: string[][];
   message?: string;
 }
 
@@ -41,6 +43,8 @@ let visualizer: NetworkVisualizer | null = null;
 let reconnectInterval: number | null = null;
 const MAX_EVENTS = 50;
 let posSocket: WebSocket | null = null;
+// Last full system state; system_state_delta messages are merged into it
+let systemState: Record<string, unknown> | null = null;
 
 const elements: DOMElements = {
   activePods: document.getElementById('active-pods'),
@@ -184,9 +188,18 @@ function connectWebSocket(): void {
 function handleMessage(payload: WebSocketMessage): void {
   switch (payload.type) {
     case 'system_state':
+      systemState = payload.data ?? null;
       updateMetrics(payload.data as unknown as UpdateMetricsPayload);
       break;
 
+    case 'system_state_delta':
+      // Ignore deltas until a full state arrives; the server resends one periodically
+      if (systemState && payload.data) {
+        mergeStateDelta(systemState, payload.data, payload.removed ?? []);
+        updateMetrics(systemState as unknown as UpdateMetricsPayload);
+      }
+      break;
+
     case 'event':
       // Forward real-time events to visualizer
       if (visualizer && payload.data) {
@@ -217,6 +230,41 @@ function handleMessage(payload: WebSocketMessage): void {
   }
 }
 
+/**
+ * Apply a delta from the dashboard: top-level keys are replaced, except
+ * object values (pods, stations, metrics) which only carry changed entries.
+ * Removed paths are deleted afterwards: [key] drops a top-level key,
+ * [key, entry] drops one entry of an object value.
+ */
+function mergeStateDelta(
+  state: Record<string, unknown>,
+  delta: Record<string, unknown>,
+  removed: string[][]
+): void {
+  for (const [key, value] of Object.entries(delta)) {
+    const current = state[key];
+    if (isPlainObject(value) && isPlainObject(current)) {
+      state[key] = { ...current, ...value };
+    } else {
+      state[key] = value;
+    }
+  }
+  for (const [key, entry] of removed) {
+    if (entry === undefined) {
+      delete state[key];
+      continue;
+    }
+    const current = state[key];
+    if (isPlainObject(current)) {
+      delete current[entry];
+    }
+  }
+}
+
+function isPlainObject(value: unknown): value is Record<string, unknown> {
+  return typeof value === 'object' && value !== null && !Array.isArray(value);
+}
+
 // --- UI Updates ---
 
 function updateMetrics(data: UpdateMetricsPayload): void {
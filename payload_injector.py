@@ -3,27 +3,57 @@ import asyncio
 import random
 import sys
 import time
-from datetime import datetime
 import httpx
 
+try:
+    import numpy as np
+except ImportError:  # numpy ships with the optional "sim" extra
+    np = None
+
 class PayloadInjector:
     """Simulates realistic network demand by injecting random requests into AEXIS."""
 
-    def __init__(self, host: str, interval: float, passenger_ratio: float):
+    # Cap on injections awaiting a response across all loops
+    MAX_IN_FLIGHT = 100
+    # Random decisions drawn per refill
+    BATCH_SIZE = 256
+
+    def __init__(self, host: str, interval: float, passenger_ratio: float, verbose: bool = False):
         self.base_url = f"http://{host.rstrip('/')}"
         self.interval = interval
         self.passenger_ratio = passenger_ratio
+        self.verbose = verbose
         self.stations = []
-        self.client = httpx.AsyncClient(timeout=10.0)
+        self._pending: set[asyncio.Task] = set()
+        self._rng = np.random.default_rng() if np is not None else None
+        self._decisions = iter(())
+        # (epoch second, formatted "%H:%M:%S") for log lines
+        self._ts_cache = (0, "")
+        # One keep-alive pool for the whole run; idle gaps between injections
+        # can exceed the default 5s expiry, so keep connections open longer
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0),
+        )
+
+    def _ts(self) -> str:
+        """Wall-clock "%H:%M:%S", formatted at most once per second."""
+        sec = int(time.time())
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime('%H:%M:%S', time.localtime(sec)))
+        return self._ts_cache[1]
 
     async def fetch_stations(self) -> bool:
         """Fetch available stations from the API."""
         try:
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] Fetching stations from {self.base_url}/api/stations...")
-            response = await self.client.get(f"{self.base_url}/api/stations")
+            print(f"[{self._ts()}] Fetching stations from {self.base_url}/api/stations...")
+            response = await self.client.get("/api/stations")
             response.raise_for_status()
             data = response.json()
             self.stations = list(data.keys())
+            # Drawn station indices refer to the old list
+            self._decisions = iter(())
             if not self.stations:
                 print("Error: No stations found in the system.")
                 return False
@@ -33,15 +63,45 @@ class PayloadInjector:
             print(f"Error fetching stations: {e}")
             return False
 
-    async def inject_passenger(self):
-        """Inject a random passenger arrival."""
-        if len(self.stations) < 2:
-            return
+    def _refill(self):
+        """Draw the next BATCH_SIZE injection decisions in one go."""
+        n, k = self.BATCH_SIZE, len(self.stations)
+        low, high = self.interval * 0.5, self.interval * 1.5
+        if self._rng is not None:
+            rng = self._rng
+            is_passenger = (rng.random(n) < self.passenger_ratio).tolist()
+            origins = rng.integers(0, k, size=n)
+            # A non-zero offset keeps origin and destination distinct
+            dests = ((origins + rng.integers(1, k, size=n)) % k).tolist()
+            origins = origins.tolist()
+            counts = rng.integers(1, 11, size=n).tolist()
+            weights = rng.integers(10, 501, size=n).astype(float).tolist()
+            sleeps = rng.uniform(low, high, size=n).tolist()
+            refresh = (rng.random(n) < 0.05).tolist()
+        else:
+            is_passenger = [random.random() < self.passenger_ratio for _ in range(n)]
+            pairs = [random.sample(range(k), 2) for _ in range(n)]
+            origins = [o for o, _ in pairs]
+            dests = [d for _, d in pairs]
+            counts = [random.randint(1, 10) for _ in range(n)]
+            weights = [float(random.randint(10, 500)) for _ in range(n)]
+            sleeps = [random.uniform(low, high) for _ in range(n)]
+            refresh = [random.random() < 0.05 for _ in range(n)]
 
-        origin, dest = random.sample(self.stations, 2)
-        count = random.randint(1, 10)
-        
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] 🚶 Injecting {count} passengers: {origin} -> {dest}")
+        self._decisions = zip(is_passenger, origins, dests, counts, weights, sleeps, refresh)
+
+    def _next_decision(self):
+        """Next (is_passenger, origin, dest, count, weight, sleep, refresh) tuple."""
+        decision = next(self._decisions, None)
+        if decision is None:
+            self._refill()
+            decision = next(self._decisions)
+        return decision
+
+    async def inject_passenger(self, origin: str, dest: str, count: int):
+        """Inject a passenger arrival."""
+        if self.verbose:
+            print(f"[{self._ts()}] 🚶 Injecting {count} passengers: {origin} -> {dest}")
         
         try:
             payload = {
@@ -49,21 +109,16 @@ class PayloadInjector:
                 "destination": dest,
                 "count": count
             }
-            response = await self.client.post(f"{self.base_url}/api/manual/passenger", json=payload)
+            response = await self.client.post("/api/manual/passenger", json=payload)
             if response.status_code != 200:
                 print(f"   Failed: {response.text}")
         except Exception as e:
             print(f"   Error: {e}")
 
-    async def inject_cargo(self):
-        """Inject a random cargo request."""
-        if len(self.stations) < 2:
-            return
-
-        origin, dest = random.sample(self.stations, 2)
-        weight = float(random.randint(10, 500))
-        
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] 📦 Injecting cargo ({weight}kg): {origin} -> {dest}")
+    async def inject_cargo(self, origin: str, dest: str, weight: float):
+        """Inject a cargo request."""
+        if self.verbose:
+            print(f"[{self._ts()}] 📦 Injecting cargo ({weight}kg): {origin} -> {dest}")
         
         try:
             payload = {
@@ -71,40 +126,63 @@ class PayloadInjector:
                 "destination": dest,
                 "weight": weight
             }
-            response = await self.client.post(f"{self.base_url}/api/manual/cargo", json=payload)
+            response = await self.client.post("/api/manual/cargo", json=payload)
             if response.status_code != 200:
                 print(f"   Failed: {response.text}")
         except Exception as e:
             print(f"   Error: {e}")
 
-    async def run(self):
+    def _spawn(self, coro):
+        """Start an injection without waiting for its response."""
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _inject_loop(self):
+        """One stream of injections; several may share the client."""
+        while True:
+            # Bound in-flight requests so a slow API can't pile up tasks
+            if len(self._pending) >= self.MAX_IN_FLIGHT:
+                await asyncio.wait(self._pending, return_when=asyncio.FIRST_COMPLETED)
+
+            if len(self.stations) < 2:
+                # Origin/destination pairs need two stations; wait for a refresh
+                await asyncio.sleep(self.interval)
+                await self.fetch_stations()
+                continue
+
+            # Stochastic decision, pre-drawn in batches
+            is_passenger, o, d, count, weight, sleep_time, refresh = self._next_decision()
+            origin, dest = self.stations[o], self.stations[d]
+            if is_passenger:
+                self._spawn(self.inject_passenger(origin, dest, count))
+            else:
+                self._spawn(self.inject_cargo(origin, dest, weight))
+
+            # Randomized sleep around the mean interval
+            await asyncio.sleep(sleep_time)
+
+            # Periodically refresh stations (every ~5 minutes of simulated time)
+            if refresh:
+                await self.fetch_stations()
+
+    async def run(self, concurrency: int = 1):
         """Main injection loop."""
         if not await self.fetch_stations():
             print("Initialization failed. Please ensure the AEXIS server is running.")
             return
 
-        print(f"\n--- Starting Payload Injection (Interval: ~{self.interval}s, Ratio: {self.passenger_ratio}) ---")
+        print(f"\n--- Starting Payload Injection (Interval: ~{self.interval}s, Ratio: {self.passenger_ratio}, Concurrency: {concurrency}) ---")
         print("Press Ctrl+C to stop.\n")
 
         try:
-            while True:
-                # Stochastic decision
-                if random.random() < self.passenger_ratio:
-                    await self.inject_passenger()
-                else:
-                    await self.inject_cargo()
-
-                # Randomized sleep around the mean interval
-                sleep_time = random.uniform(self.interval * 0.5, self.interval * 1.5)
-                await asyncio.sleep(sleep_time)
-                
-                # Periodically refresh stations (every ~5 minutes of simulated time)
-                if random.random() < 0.05:
-                    await self.fetch_stations()
-
+            await asyncio.gather(*(self._inject_loop() for _ in range(concurrency)))
         except asyncio.CancelledError:
             print("\nStopping injector...")
         finally:
+            for task in list(self._pending):
+                task.cancel()
+            await asyncio.gather(*self._pending, return_exceptions=True)
             await self.client.aclose()
 
 async def main():
@@ -112,12 +190,14 @@ async def main():
     parser.add_argument("--host", default="localhost:8000", help="API host (default: localhost:8000)")
     parser.add_argument("--interval", type=float, default=5.0, help="Average interval between injections in seconds (default: 5.0)")
     parser.add_argument("--ratio", type=float, default=0.7, help="Ratio of passengers vs cargo (default: 0.7)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Parallel injection loops sharing one client (default: 1)")
+    parser.add_argument("--verbose", action="store_true", help="Log every injection")
     
     args = parser.parse_args()
     
-    injector = PayloadInjector(args.host, args.interval, args.ratio)
+    injector = PayloadInjector(args.host, args.interval, args.ratio, args.verbose)
     try:
-        await injector.run()
+        await injector.run(args.concurrency)
     except KeyboardInterrupt:
         pass
 